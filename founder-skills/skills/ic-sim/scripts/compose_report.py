@@ -23,71 +23,58 @@ import json
 import os
 import re
 import sys
+from collections import Counter
 from datetime import datetime, timedelta
 from typing import Any, TypeGuard
 
-# Canonical warning severity map.
-# high = must fix before presenting, medium = warn in report,
-# low = note in appendix, info = note in report metadata.
 _CORRUPT: dict[str, Any] = {"__corrupt__": True}
 KNOWN_STAGES = {"pre_seed", "seed", "series_a"}
+# Maps "-" and " " to "_" in one pass when normalizing verdicts and stages.
+_UNDERSCORE_SEPARATORS = str.maketrans("- ", "__")
+# Trailing legal suffix (" inc.", " llc", " ltd", " corp.", ...) stripped before matching.
+_LEGAL_SUFFIX_RE = re.compile(r"\s+(?:inc\.?|llc|ltd\.?|corp\.?)$")
+_WS_RE = re.compile(r"\s+")
 
-WARNING_SEVERITY: dict[str, str] = {
+# Canonical warning table: code -> (severity, human-readable label).
+# high = must fix before presenting, medium = warn in report,
+# low = note in appendix, info = note in report metadata.
+WARNING_META: dict[str, tuple[str, str]] = {
     # High — structural integrity violations
-    "CORRUPT_ARTIFACT": "high",
-    "MISSING_ARTIFACT": "high",
-    "BLOCKING_CONFLICT": "high",
-    "ORPHANED_CONFLICT": "high",
-    "VERDICT_SCORE_MISMATCH": "high",
+    "CORRUPT_ARTIFACT": ("high", "Corrupt Artifact"),
+    "MISSING_ARTIFACT": ("high", "Missing Artifact"),
+    "BLOCKING_CONFLICT": ("high", "Blocking Conflict"),
+    "ORPHANED_CONFLICT": ("high", "Orphaned Conflict"),
+    "VERDICT_SCORE_MISMATCH": ("high", "Verdict/Score Mismatch"),
     # Medium — quality concerns worth surfacing
-    "PARTNER_UNANIMITY": "medium",
-    "ZERO_APPLICABLE": "medium",
-    "STALE_IMPORT": "medium",
-    "LOW_EVIDENCE": "medium",
-    "FUND_VALIDATION_ERROR": "medium",
-    "DEGRADED_ASSESSMENT": "medium",
-    "CONSENSUS_SCORE_MISMATCH": "medium",
-    "UNANIMOUS_VERDICT_MISMATCH": "medium",
-    "SHALLOW_ASSESSMENT": "medium",
-    "HIGH_NA_COUNT": "medium",
+    "PARTNER_UNANIMITY": ("medium", "Partner Unanimity"),
+    "ZERO_APPLICABLE": ("medium", "Zero Applicable Dimensions"),
+    "STALE_IMPORT": ("medium", "Stale Import"),
+    "LOW_EVIDENCE": ("medium", "Low Evidence"),
+    "FUND_VALIDATION_ERROR": ("medium", "Fund Validation Error"),
+    "DEGRADED_ASSESSMENT": ("medium", "Degraded Assessment"),
+    "CONSENSUS_SCORE_MISMATCH": ("medium", "Consensus/Score Verdict Mismatch"),
+    "UNANIMOUS_VERDICT_MISMATCH": ("medium", "Unanimous Verdict Mismatch"),
+    "SHALLOW_ASSESSMENT": ("medium", "Shallow Assessment"),
+    "HIGH_NA_COUNT": ("medium", "High N/A Count"),
     # Low — minor notes
-    "SCHEMA_DRIFT": "low",
-    "STAGE_OUT_OF_SCOPE": "low",
+    "SCHEMA_DRIFT": ("low", "Schema Drift"),
+    "STAGE_OUT_OF_SCOPE": ("low", "Stage Out of Scope"),
     # Info — transparency, no action needed
-    "PARTNER_CONVERGENCE": "info",
-    "SEQUENTIAL_FALLBACK": "info",
+    "PARTNER_CONVERGENCE": ("info", "Partner Convergence"),
+    "SEQUENTIAL_FALLBACK": ("info", "Sequential Fallback"),
 }
 
+# Severity-only view, used by _warn and accepted_warnings handling.
+WARNING_SEVERITY: dict[str, str] = {code: severity for code, (severity, _label) in WARNING_META.items()}
+
 # Only medium-severity codes can be accepted. High-severity = integrity violations.
 ACCEPTIBLE_SEVERITIES = {"medium"}
 
-# Human-readable warning code labels
-WARNING_LABELS: dict[str, str] = {
-    "CORRUPT_ARTIFACT": "Corrupt Artifact",
-    "MISSING_ARTIFACT": "Missing Artifact",
-    "BLOCKING_CONFLICT": "Blocking Conflict",
-    "ORPHANED_CONFLICT": "Orphaned Conflict",
-    "VERDICT_SCORE_MISMATCH": "Verdict/Score Mismatch",
-    "PARTNER_UNANIMITY": "Partner Unanimity",
-    "ZERO_APPLICABLE": "Zero Applicable Dimensions",
-    "STALE_IMPORT": "Stale Import",
-    "LOW_EVIDENCE": "Low Evidence",
-    "FUND_VALIDATION_ERROR": "Fund Validation Error",
-    "DEGRADED_ASSESSMENT": "Degraded Assessment",
-    "CONSENSUS_SCORE_MISMATCH": "Consensus/Score Verdict Mismatch",
-    "UNANIMOUS_VERDICT_MISMATCH": "Unanimous Verdict Mismatch",
-    "SHALLOW_ASSESSMENT": "Shallow Assessment",
-    "HIGH_NA_COUNT": "High N/A Count",
-    "SCHEMA_DRIFT": "Schema Drift",
-    "STAGE_OUT_OF_SCOPE": "Stage Out of Scope",
-    "PARTNER_CONVERGENCE": "Partner Convergence",
-    "SEQUENTIAL_FALLBACK": "Sequential Fallback",
-}
-
 
 def _humanize_warning(code: str) -> str:
     """Convert a warning code to human-readable label."""
-    return WARNING_LABELS.get(code, code.replace("_", " ").title())
+    meta = WARNING_META.get(code)
+    return meta[1] if meta else code.replace("_", " ").title()
 
 
 REQUIRED_ARTIFACTS = [
@@ -210,8 +197,8 @@ VERDICT_SCORE_RANGES: dict[str, tuple[float, float]] = {
 }
 
 
-def _write_output(data: str, output_path: str | None) -> None:
-    """Write JSON string to file or stdout."""
+def _write_output(data: bytes, output_path: str | None) -> None:
+    """Write UTF-8 encoded JSON to file or stdout."""
     if output_path:
         abs_path = os.path.abspath(output_path)
         parent = os.path.dirname(abs_path)
@@ -219,21 +206,25 @@ def _write_output(data: str, output_path: str | None) -> None:
             print(f"Error: output path resolves to root directory: {output_path}", file=sys.stderr)
             sys.exit(1)
         os.makedirs(parent, exist_ok=True)
-        with open(abs_path, "w", encoding="utf-8") as f:
+        with open(abs_path, "wb") as f:
             f.write(data)
     else:
-        sys.stdout.write(data)
+        sys.stdout.buffer.write(data)
 
 
 def _load_artifact(dir_path: str, name: str) -> dict[str, Any] | None:
-    """Load a JSON artifact. Returns None if missing, _CORRUPT if unparseable."""
+    """Load a JSON artifact. Returns None if missing, _CORRUPT if unparseable or not UTF-8.
+
+    Callers skip names absent from a single os.listdir() of the directory rather
+    than probing each file; FileNotFoundError still maps to None.
+    """
     path = os.path.join(dir_path, name)
-    if not os.path.exists(path):
-        return None
     try:
-        with open(path, encoding="utf-8") as f:
-            return json.load(f)  # type: ignore[no-any-return]
-    except (json.JSONDecodeError, OSError):
+        with open(path, "rb") as f:
+            return json.loads(f.read())  # type: ignore[no-any-return]
+    except FileNotFoundError:
+        return None
+    except (ValueError, OSError):
         return _CORRUPT
 
 
@@ -248,17 +239,21 @@ def _usable(data: dict[str, Any] | None) -> TypeGuard[dict[str, Any]]:
 
 
 def _as_list(value: Any) -> list[Any]:
-    """Coerce to list — returns [] if not a list."""
-    return value if isinstance(value, list) else []
+    """Coerce to list — returns [] if not a list (json.load never yields list subclasses)."""
+    return value if type(value) is list else []
 
 
 def _as_dict(value: Any) -> dict[str, Any]:
-    """Coerce to dict — returns {} if not a dict."""
-    return value if isinstance(value, dict) else {}
+    """Coerce to dict — returns {} if not a dict (json.load never yields dict subclasses)."""
+    return value if type(value) is dict else {}
 
 
 def _warn(code: str, message: str) -> dict[str, str]:
-    """Create a warning dict with code, message, and severity."""
+    """Create a warning dict with code, message, and severity.
+
+    Each call returns a fresh dict: compose() rewrites severity/message in place
+    when applying accepted_warnings, so warnings must not share a template.
+    """
     return {
         "code": code,
         "message": message,
@@ -278,24 +273,20 @@ def _fmt_number(val: Any, fallback: str = "?") -> str:
 
 def _normalize_ws(s: str) -> str:
     """Normalize whitespace for comparison: collapse runs and strip."""
-    return re.sub(r"\s+", " ", s).strip()
+    return _WS_RE.sub(" ", s).strip()
 
 
 def _normalize_company(name: str) -> str:
     """Normalize company name for matching: strip legal suffixes, lowercase, collapse whitespace."""
-    name = name.strip().lower()
-    for suffix in (" inc.", " inc", " llc", " ltd.", " ltd", " corp.", " corp"):
-        if name.endswith(suffix):
-            name = name[: -len(suffix)]
-            break
-    return re.sub(r"\s+", " ", name).strip()
+    name = _LEGAL_SUFFIX_RE.sub("", name.strip().lower(), count=1)
+    return _WS_RE.sub(" ", name).strip()
 
 
 def _normalize_verdict(v: Any) -> str:
     """Normalize a verdict string for comparison. Returns '' for non-string/empty."""
     if not isinstance(v, str) or not v.strip():
         return ""
-    return v.strip().lower().replace("-", "_").replace(" ", "_")
+    return v.strip().lower().translate(_UNDERSCORE_SEPARATORS)
 
 
 def validate_artifacts(artifacts: dict[str, dict[str, Any] | None]) -> list[dict[str, str]]:
@@ -308,6 +299,30 @@ def validate_artifacts(artifacts: dict[str, dict[str, Any] | None]) -> list[dict
     score_dims = artifacts.get("score_dimensions.json")
     prior = artifacts.get("prior_artifacts.json")
 
+    # Discussion fields shared by checks 4b, 4c, 5, 10, 10b and 13 — resolved once.
+    discussion_ok = False
+    partner_verdicts: list[Any] = []
+    assessment_mode: Any = None
+    mode_intentional = False
+    consensus_raw: Any = None
+    consensus_v = ""
+    if _usable(discussion):
+        discussion_ok = True
+        partner_verdicts = _as_list(discussion.get("partner_verdicts"))
+        assessment_mode = discussion.get("assessment_mode")
+        mode_intentional = bool(discussion.get("assessment_mode_intentional"))
+        consensus_raw = discussion.get("consensus_verdict")
+        consensus_v = _normalize_verdict(consensus_raw)
+
+    # Score summary fields shared by checks 4, 4b and 6.
+    score_ok = False
+    score_summary: dict[str, Any] = {}
+    if _usable(score_dims):
+        score_ok = True
+        score_summary = _as_dict(score_dims.get("summary"))
+    score_warnings = _as_list(score_summary.get("warnings"))
+    score_verdict_raw = score_summary.get("verdict")
+
     # 1. CORRUPT_ARTIFACT / MISSING_ARTIFACT — required artifacts
     for name in REQUIRED_ARTIFACTS:
         data = artifacts.get(name)
@@ -324,12 +339,15 @@ def validate_artifacts(artifacts: dict[str, dict[str, Any] | None]) -> list[dict
                 _warn("BLOCKING_CONFLICT", "Portfolio has a blocking conflict — cannot proceed with investment")
             )
 
+    # Per-element loops below use `type(x) is dict`: artifacts come from json.load,
+    # which never yields dict subclasses, so the exact-type check is equivalent.
+
     # 3. ORPHANED_CONFLICT — conflict company not found in fund_profile portfolio
     if _usable(conflict_check) and _usable(fund_profile):
         portfolio_names = {
             _normalize_company(entry.get("name", ""))
             for entry in _as_list(fund_profile.get("portfolio"))
-            if isinstance(entry, dict)
+            if type(entry) is dict
         }
         for conflict in _as_list(conflict_check.get("conflicts")):
             company = conflict.get("company", "")
@@ -343,11 +361,9 @@ def validate_artifacts(artifacts: dict[str, dict[str, Any] | None]) -> list[dict
                 )
 
     # 4. VERDICT_SCORE_MISMATCH
-    if _usable(score_dims):
-        score_summary = _as_dict(score_dims.get("summary"))
-        score_warnings = _as_list(score_summary.get("warnings"))
+    if score_ok:
         conviction_score = score_summary.get("conviction_score", 0.0)
-        verdict = score_summary.get("verdict", "")
+        verdict = score_verdict_raw or ""
 
         # Suppress if ZERO_APPLICABLE_DIMENSIONS present
         has_zero_applicable = "ZERO_APPLICABLE_DIMENSIONS" in score_warnings
@@ -364,15 +380,14 @@ def validate_artifacts(artifacts: dict[str, dict[str, Any] | None]) -> list[dict
                 )
 
     # 4b. CONSENSUS_SCORE_MISMATCH
-    if _usable(discussion) and _usable(score_dims):
-        consensus_v = _normalize_verdict(discussion.get("consensus_verdict"))
-        score_v = _normalize_verdict(_as_dict(score_dims.get("summary")).get("verdict"))
+    if discussion_ok and score_ok:
+        score_v = _normalize_verdict(score_verdict_raw)
         if consensus_v and score_v and consensus_v != score_v:
             warnings.append(
                 _warn(
                     "CONSENSUS_SCORE_MISMATCH",
-                    f"Discussion consensus verdict '{discussion.get('consensus_verdict')}' "
-                    f"differs from score verdict '{_as_dict(score_dims.get('summary')).get('verdict')}' "
+                    f"Discussion consensus verdict '{consensus_raw}' "
+                    f"differs from score verdict '{score_verdict_raw}' "
                     "— review for consistency",
                 )
             )
@@ -382,18 +397,15 @@ def validate_artifacts(artifacts: dict[str, dict[str, Any] | None]) -> list[dict
     # the opposite. Individual dissent (1-2 out of 3) is normal and ignored.
     _POSITIVE_VERDICTS = {"invest", "more_diligence"}
     _NEGATIVE_VERDICTS = {"pass", "hard_pass"}
-    if _usable(discussion):
-        consensus = _normalize_verdict(discussion.get("consensus_verdict"))
+    if discussion_ok:
         partner_verdicts_list = [
-            _normalize_verdict(pv.get("verdict"))
-            for pv in _as_list(discussion.get("partner_verdicts"))
-            if isinstance(pv, dict) and pv.get("verdict")
+            _normalize_verdict(pv.get("verdict")) for pv in partner_verdicts if type(pv) is dict and pv.get("verdict")
         ]
         if partner_verdicts_list:
             all_positive = all(v in _POSITIVE_VERDICTS for v in partner_verdicts_list)
             all_negative = all(v in _NEGATIVE_VERDICTS for v in partner_verdicts_list)
-            consensus_positive = consensus in _POSITIVE_VERDICTS
-            consensus_negative = consensus in _NEGATIVE_VERDICTS
+            consensus_positive = consensus_v in _POSITIVE_VERDICTS
+            consensus_negative = consensus_v in _NEGATIVE_VERDICTS
             if (all_positive and consensus_negative) or (all_negative and consensus_positive):
                 warnings.append(
                     _warn(
@@ -401,7 +413,7 @@ def validate_artifacts(artifacts: dict[str, dict[str, Any] | None]) -> list[dict
                         (
                             f"All {len(partner_verdicts_list)} partners are "
                             f"{'positive' if all_positive else 'negative'} "
-                            f"but consensus is '{discussion.get('consensus_verdict')}' "
+                            f"but consensus is '{consensus_raw}' "
                             f"({'negative' if consensus_negative else 'positive'}) "
                             "— partner_verdicts or consensus_verdict likely not "
                             "updated after debate"
@@ -410,50 +422,43 @@ def validate_artifacts(artifacts: dict[str, dict[str, Any] | None]) -> list[dict
                 )
 
     # 5. PARTNER_UNANIMITY / PARTNER_CONVERGENCE
-    if _usable(discussion):
-        partner_verdicts = _as_list(discussion.get("partner_verdicts"))
-        assessment_mode = discussion.get("assessment_mode", "sequential")
-
-        if len(partner_verdicts) == 3:
-            verdicts_list = [pv.get("verdict") for pv in partner_verdicts]
-            rationales = [pv.get("rationale", "") for pv in partner_verdicts]
-
-            if len(set(verdicts_list)) == 1:
-                # All agree — check for copy-paste rationales
-                normalized = [_normalize_ws(r) for r in rationales]
-                # Any 2 rationales identical after normalization?
-                has_identical = False
-                for i in range(len(normalized)):
-                    for j in range(i + 1, len(normalized)):
-                        if normalized[i] == normalized[j]:
-                            has_identical = True
-                            break
-                    if has_identical:
+    if discussion_ok and len(partner_verdicts) == 3:
+        verdicts_list = [pv.get("verdict") for pv in partner_verdicts]
+        rationales = [pv.get("rationale", "") for pv in partner_verdicts]
+
+        if len(set(verdicts_list)) == 1:
+            # All agree — check for copy-paste rationales
+            normalized = [_normalize_ws(r) for r in rationales]
+            # Any 2 rationales identical after normalization?
+            has_identical = False
+            for i in range(len(normalized)):
+                for j in range(i + 1, len(normalized)):
+                    if normalized[i] == normalized[j]:
+                        has_identical = True
                         break
-
                 if has_identical:
+                    break
+
+            if has_identical:
+                warnings.append(
+                    _warn(
+                        "PARTNER_UNANIMITY",
+                        "All 3 partners agree on verdict AND share identical rationales — flags generation collapse",
+                    )
+                )
+            else:
+                # Convergence: only noteworthy in sub-agent mode
+                if assessment_mode == "sub-agent":
                     warnings.append(
                         _warn(
-                            "PARTNER_UNANIMITY",
-                            "All 3 partners agree on verdict AND share identical"
-                            " rationales — flags generation collapse",
+                            "PARTNER_CONVERGENCE",
+                            "All 3 partners independently converged on the same verdict with distinct rationales",
                         )
                     )
-                else:
-                    # Convergence: only noteworthy in sub-agent mode
-                    if assessment_mode == "sub-agent":
-                        warnings.append(
-                            _warn(
-                                "PARTNER_CONVERGENCE",
-                                "All 3 partners independently converged on the same verdict with distinct rationales",
-                            )
-                        )
 
     # 6. ZERO_APPLICABLE
-    if _usable(score_dims):
-        score_warnings = _as_list(_as_dict(score_dims.get("summary")).get("warnings"))
-        if "ZERO_APPLICABLE_DIMENSIONS" in score_warnings:
-            warnings.append(_warn("ZERO_APPLICABLE", "All dimensions marked not_applicable — score is 0.0"))
+    if score_ok and "ZERO_APPLICABLE_DIMENSIONS" in score_warnings:
+        warnings.append(_warn("ZERO_APPLICABLE", "All dimensions marked not_applicable — score is 0.0"))
 
     # 7. STALE_IMPORT
     if _usable(prior):
@@ -473,18 +478,23 @@ def validate_artifacts(artifacts: dict[str, dict[str, Any] | None]) -> list[dict
                 except ValueError:
                     pass
 
-    # 8. LOW_EVIDENCE
+    # 8. LOW_EVIDENCE — same pass also counts not_applicable items for check 10c
+    na_count = 0
     if _usable(score_dims):
         for item in _as_list(score_dims.get("items")):
-            if item.get("status") != "not_applicable":
-                evidence = item.get("evidence")
-                if not evidence or (isinstance(evidence, str) and evidence.strip() == ""):
-                    warnings.append(
-                        _warn(
-                            "LOW_EVIDENCE",
-                            f"Dimension '{item.get('id', '?')}' has no evidence field",
-                        )
+            if type(item) is not dict:
+                continue
+            if item.get("status") == "not_applicable":
+                na_count += 1
+                continue
+            evidence = item.get("evidence")
+            if not evidence or (isinstance(evidence, str) and evidence.strip() == ""):
+                warnings.append(
+                    _warn(
+                        "LOW_EVIDENCE",
+                        f"Dimension '{item.get('id', '?')}' has no evidence field",
                     )
+                )
 
     # 9. FUND_VALIDATION_ERROR
     if _usable(fund_profile):
@@ -498,8 +508,8 @@ def validate_artifacts(artifacts: dict[str, dict[str, Any] | None]) -> list[dict
                 )
             )
 
-    # 10. DEGRADED_ASSESSMENT
-    if _usable(discussion) and discussion.get("assessment_mode") == "sub-agent":
+    # 10. DEGRADED_ASSESSMENT / 10b. SHALLOW_ASSESSMENT (sub-agent mode only)
+    if discussion_ok and assessment_mode == "sub-agent":
         for pa_file in PARTNER_ASSESSMENT_FILES:
             if artifacts.get(pa_file) is None:
                 warnings.append(
@@ -509,8 +519,7 @@ def validate_artifacts(artifacts: dict[str, dict[str, Any] | None]) -> list[dict
                     )
                 )
 
-    # 10b. SHALLOW_ASSESSMENT (sub-agent mode only, present files only)
-    if _usable(discussion) and discussion.get("assessment_mode") == "sub-agent":
+        # 10b. SHALLOW_ASSESSMENT — present files only
         for pa_file in PARTNER_ASSESSMENT_FILES:
             pa_data = artifacts.get(pa_file)
             if _usable(pa_data):
@@ -532,20 +541,14 @@ def validate_artifacts(artifacts: dict[str, dict[str, Any] | None]) -> list[dict
                         )
                     )
 
-    # 10c. HIGH_NA_COUNT
-    if _usable(score_dims):
-        na_count = sum(
-            1
-            for item in _as_list(score_dims.get("items"))
-            if isinstance(item, dict) and item.get("status") == "not_applicable"
-        )
-        if na_count > 6:
-            warnings.append(
-                _warn(
-                    "HIGH_NA_COUNT",
-                    f"{na_count} of 28 dimensions marked not_applicable — conviction score may be inflated",
-                )
+    # 10c. HIGH_NA_COUNT (na_count tallied during the LOW_EVIDENCE pass)
+    if na_count > 6:
+        warnings.append(
+            _warn(
+                "HIGH_NA_COUNT",
+                f"{na_count} of 28 dimensions marked not_applicable — conviction score may be inflated",
             )
+        )
 
     # 11. SCHEMA_DRIFT
     for name, expected in EXPECTED_KEYS.items():
@@ -573,7 +576,7 @@ def validate_artifacts(artifacts: dict[str, dict[str, Any] | None]) -> list[dict
     # 12. STAGE_OUT_OF_SCOPE
     startup = artifacts.get("startup_profile.json")
     if _usable(startup):
-        stage = (startup.get("stage") or "").lower().replace("-", "_").replace(" ", "_")
+        stage = (startup.get("stage") or "").lower().translate(_UNDERSCORE_SEPARATORS)
         if stage and stage not in KNOWN_STAGES:
             warnings.append(
                 _warn(
@@ -584,11 +587,7 @@ def validate_artifacts(artifacts: dict[str, dict[str, Any] | None]) -> list[dict
             )
 
     # 13. SEQUENTIAL_FALLBACK
-    if (
-        _usable(discussion)
-        and discussion.get("assessment_mode") == "sequential"
-        and not discussion.get("assessment_mode_intentional")
-    ):
+    if discussion_ok and assessment_mode == "sequential" and not mode_intentional:
         warnings.append(
             _warn(
                 "SEQUENTIAL_FALLBACK",
@@ -599,40 +598,64 @@ def validate_artifacts(artifacts: dict[str, dict[str, Any] | None]) -> list[dict
     return warnings
 
 
-def _section_title(profile: dict[str, Any] | None) -> str:
+# Report rendering lookup tables.
+_VERDICT_LABELS: dict[str, str] = {
+    "invest": "Invest — strong enough for a term sheet discussion",
+    "more_diligence": "More Diligence — promising but needs more evidence",
+    "pass": "Pass — too many concerns to proceed at this time",
+    "hard_pass": "Hard Pass — fatal flaw identified",
+}
+
+_STATUS_ICONS: dict[str, str] = {
+    "strong_conviction": "STRONG",
+    "moderate_conviction": "MODERATE",
+    "concern": "CONCERN",
+    "dealbreaker": "DEALBREAKER",
+    "not_applicable": "N/A",
+}
+
+_SEV_ICONS: dict[str, str] = {"high": "!!!", "medium": "!!", "acknowledged": "~", "low": "i", "info": "~"}
+
+
+def _section_title(profile: dict[str, Any] | None) -> list[str]:
     """Report title."""
     if profile is None:
-        return "# IC Simulation Report\n\n*No startup profile found.*\n"
+        return ["# IC Simulation Report\n", "*No startup profile found.*"]
     company = profile.get("company_name", "Unknown Company")
     date = profile.get("simulation_date", "unknown date")
     stage = (profile.get("stage") or "unknown").replace("_", " ").title()
-    return (
-        f"# IC Simulation: {company}\n\n"
-        f"**Date:** {date} | **Stage:** {stage}  \n"
+    return [
+        f"# IC Simulation: {company}\n",
+        f"**Date:** {date} | **Stage:** {stage}  ",
         "**Generated by:** [founder skills](https://github.com/lool-ventures/founder-skills)"
         " by [lool ventures](https://lool.vc)"
-        " — IC Simulation Agent\n\n"
+        " — IC Simulation Agent\n",
         "> *This is an AI simulation. Partner verdicts, debate positions, and questions are "
         "generated based on archetype personas and provided materials. They represent plausible "
-        "perspectives, not actual VC feedback.*\n"
-    )
+        "perspectives, not actual VC feedback.*",
+    ]
 
 
 def _section_executive_summary(
     profile: dict[str, Any] | None,
     score_dims: dict[str, Any] | None,
     discussion: dict[str, Any] | None,
-) -> str:
+) -> list[str]:
     """Executive summary with verdict, score, and partner split."""
     lines = ["## Executive Summary\n"]
+    # Stubs render like absent artifacts; resolve that once for every block below.
+    if _is_stub(score_dims):
+        score_dims = None
+    if _is_stub(discussion):
+        discussion = None
+    summary = _as_dict(score_dims.get("summary")) if score_dims is not None else {}
 
     if profile is not None and not _is_stub(profile):
         lines.append(f"**Company:** {profile.get('company_name', '?')}")
         lines.append(f"**One-liner:** {profile.get('one_liner', '?')}")
         lines.append(f"**Sector:** {profile.get('sector', '?')}")
 
-    if score_dims is not None and not _is_stub(score_dims):
-        summary = _as_dict(score_dims.get("summary"))
+    if score_dims is not None:
         score = summary.get("conviction_score", 0)
         verdict = summary.get("verdict", "unknown")
         strong = summary.get("strong_conviction", 0)
@@ -640,17 +663,12 @@ def _section_executive_summary(
         concern = summary.get("concern", 0)
         db = summary.get("dealbreaker", 0)
 
-        verdict_label = {
-            "invest": "Invest — strong enough for a term sheet discussion",
-            "more_diligence": "More Diligence — promising but needs more evidence",
-            "pass": "Pass — too many concerns to proceed at this time",
-            "hard_pass": "Hard Pass — fatal flaw identified",
-        }.get(verdict, verdict)
+        verdict_label = _VERDICT_LABELS.get(verdict, verdict)
 
         lines.append(f"**Conviction Score:** {score}% — {verdict_label}")
         lines.append(f"**Breakdown:** {strong} strong, {moderate} moderate, {concern} concern, {db} dealbreaker")
 
-    if discussion is not None and not _is_stub(discussion):
+    if discussion is not None:
         partner_verdicts = _as_list(discussion.get("partner_verdicts"))
         if partner_verdicts:
             verdict_strs = [
@@ -659,25 +677,25 @@ def _section_executive_summary(
             lines.append(f"**Partner Split:** {' | '.join(verdict_strs)}")
 
     # Consensus/Score verdict mismatch note
-    if score_dims is not None and not _is_stub(score_dims) and discussion is not None and not _is_stub(discussion):
+    if score_dims is not None and discussion is not None:
+        score_verdict = summary.get("verdict")
         consensus_v = _normalize_verdict(discussion.get("consensus_verdict"))
-        score_v = _normalize_verdict(_as_dict(score_dims.get("summary")).get("verdict"))
+        score_v = _normalize_verdict(score_verdict)
         if consensus_v and score_v and consensus_v != score_v:
             lines.append("")
-            score_verdict = _as_dict(score_dims.get("summary")).get("verdict")
             lines.append(
                 f"> **Note:** The IC discussion consensus (*{discussion.get('consensus_verdict')}*) "
                 f"differs from the quantitative score verdict (*{score_verdict}*). "
                 "This can occur when qualitative debate conclusions override borderline numeric scores."
             )
 
-    return "\n".join(lines) + "\n"
+    return lines
 
 
-def _section_fund_profile(fund: dict[str, Any] | None) -> str:
+def _section_fund_profile(fund: dict[str, Any] | None) -> list[str]:
     """Fund profile summary."""
     if fund is None or _is_stub(fund):
-        return "## Fund Profile\n\n*No fund profile available.*\n"
+        return ["## Fund Profile\n", "*No fund profile available.*"]
 
     lines = ["## Fund Profile\n"]
     lines.append(f"**Fund:** {fund.get('fund_name', '?')}")
@@ -702,13 +720,13 @@ def _section_fund_profile(fund: dict[str, Any] | None) -> str:
             name = arch.get("name", "?")
             lines.append(f"- **{name}** ({role}): {arch.get('background', '?')}")
 
-    return "\n".join(lines) + "\n"
+    return lines
 
 
-def _section_conflict_check(conflict: dict[str, Any] | None) -> str:
+def _section_conflict_check(conflict: dict[str, Any] | None) -> list[str]:
     """Conflict check results."""
     if conflict is None or _is_stub(conflict):
-        return "## Conflict Check\n\n*No conflict check available.*\n"
+        return ["## Conflict Check\n", "*No conflict check available.*"]
 
     summary = _as_dict(conflict.get("summary"))
     lines = ["## Conflict Check\n"]
@@ -723,13 +741,13 @@ def _section_conflict_check(conflict: dict[str, Any] | None) -> str:
             sev = c.get("severity", "?").upper()
             lines.append(f"- **[{sev}]** {c.get('company', '?')} ({c.get('type', '?')}): {c.get('rationale', '?')}")
 
-    return "\n".join(lines) + "\n"
+    return lines
 
 
-def _section_discussion(discussion: dict[str, Any] | None) -> str:
+def _section_discussion(discussion: dict[str, Any] | None) -> list[str]:
     """Discussion summary with partner positions and debate."""
     if discussion is None or _is_stub(discussion):
-        return "## Discussion Summary\n\n*No discussion available.*\n"
+        return ["## Discussion Summary\n", "*No discussion available.*"]
 
     lines = ["## Discussion Summary\n"]
     lines.append(f"**Assessment Mode:** {discussion.get('assessment_mode', '?')}")
@@ -755,13 +773,13 @@ def _section_discussion(discussion: dict[str, Any] | None) -> str:
                 position = exchange.get("position") or ""
                 lines.append(f"> **{partner}:** {position}\n")
 
-    return "\n".join(lines) + "\n"
+    return lines
 
 
-def _section_scorecard(score_dims: dict[str, Any] | None) -> str:
+def _section_scorecard(score_dims: dict[str, Any] | None) -> list[str]:
     """Dimension scorecard table."""
     if score_dims is None or _is_stub(score_dims):
-        return "## Dimension Scorecard\n\n*No scorecard available.*\n"
+        return ["## Dimension Scorecard\n", "*No scorecard available.*"]
 
     items = _as_list(score_dims.get("items"))
     summary = _as_dict(score_dims.get("summary"))
@@ -776,86 +794,83 @@ def _section_scorecard(score_dims: dict[str, Any] | None) -> str:
     # Category summary
     lines.append("| Category | Strong | Moderate | Concern | Dealbreaker | N/A |")
     lines.append("|----------|--------|----------|---------|-------------|-----|")
-    for cat, counts in by_cat.items():
-        lines.append(
-            f"| {cat} | {counts.get('strong_conviction', 0)} | {counts.get('moderate_conviction', 0)} "
-            f"| {counts.get('concern', 0)} | {counts.get('dealbreaker', 0)} "
-            f"| {counts.get('not_applicable', 0)} |"
-        )
+    lines.extend(
+        f"| {cat} | {counts.get('strong_conviction', 0)} | {counts.get('moderate_conviction', 0)} "
+        f"| {counts.get('concern', 0)} | {counts.get('dealbreaker', 0)} "
+        f"| {counts.get('not_applicable', 0)} |"
+        for cat, counts in by_cat.items()
+    )
     lines.append("")
 
     # Full item table
-    status_icons = {
-        "strong_conviction": "STRONG",
-        "moderate_conviction": "MODERATE",
-        "concern": "CONCERN",
-        "dealbreaker": "DEALBREAKER",
-        "not_applicable": "N/A",
-    }
-
     lines.append("| # | Category | Dimension | Status |")
     lines.append("|---|----------|-----------|--------|")
-    for i, item in enumerate(items, 1):
-        cat = item.get("category", "?")
-        label = item.get("label", item.get("id", "?"))
-        status = status_icons.get(item.get("status", "?"), "?")
-        lines.append(f"| {i} | {cat} | {label} | {status} |")
+    lines.extend(
+        f"| {i} | {item.get('category', '?')} | {item.get('label') or item.get('id') or '?'} "
+        f"| {_STATUS_ICONS.get(item.get('status', '?'), '?')} |"
+        for i, item in enumerate(items, 1)
+    )
+
+    return lines
+
 
-    return "\n".join(lines) + "\n"
+def _flagged_item_lines(entries: list[Any]) -> list[str]:
+    """Bullet lines for dealbreaker/concern entries, with an indented notes line when present."""
+    lines: list[str] = []
+    for entry in entries:
+        label = entry.get("label") or entry.get("id") or "?"
+        notes = entry.get("notes")
+        lines.append(f"- **{label}** ({entry.get('category', '?')})")
+        if notes:
+            lines.append(f"  - {notes}")
+    return lines
 
 
-def _section_concerns(score_dims: dict[str, Any] | None) -> str:
+def _section_concerns(score_dims: dict[str, Any] | None) -> list[str]:
     """Concerns and dealbreakers."""
     if score_dims is None or _is_stub(score_dims):
-        return ""
+        return []
 
     summary = _as_dict(score_dims.get("summary"))
     dealbreakers = _as_list(summary.get("dealbreakers"))
     concerns = _as_list(summary.get("top_concerns"))
 
     if not dealbreakers and not concerns:
-        return ""
+        return []
 
     lines = ["## Concerns and Dealbreakers\n"]
 
     if dealbreakers:
         lines.append("### Dealbreakers\n")
-        for db in dealbreakers:
-            lines.append(f"- **{db.get('label', db.get('id', '?'))}** ({db.get('category', '?')})")
-            if db.get("notes"):
-                lines.append(f"  - {db['notes']}")
+        lines.extend(_flagged_item_lines(dealbreakers))
         lines.append("")
 
     if concerns:
         lines.append("### Key Concerns\n")
-        for c in concerns:
-            lines.append(f"- **{c.get('label', c.get('id', '?'))}** ({c.get('category', '?')})")
-            if c.get("notes"):
-                lines.append(f"  - {c['notes']}")
+        lines.extend(_flagged_item_lines(concerns))
         lines.append("")
 
-    return "\n".join(lines) + "\n"
+    return lines
 
 
-def _section_diligence(discussion: dict[str, Any] | None) -> str:
+def _section_diligence(discussion: dict[str, Any] | None) -> list[str]:
     """Diligence requirements from the discussion."""
     if discussion is None or _is_stub(discussion):
-        return ""
+        return []
 
     reqs = _as_list(discussion.get("diligence_requirements"))
     if not reqs:
-        return ""
+        return []
 
     lines = ["## Diligence Requirements\n"]
-    for i, req in enumerate(reqs, 1):
-        lines.append(f"{i}. {req}")
-    return "\n".join(lines) + "\n"
+    lines.extend(f"{i}. {req}" for i, req in enumerate(reqs, 1))
+    return lines
 
 
 def _section_coaching(
     discussion: dict[str, Any] | None,
     score_dims: dict[str, Any] | None,
-) -> str:
+) -> list[str]:
     """Founder coaching based on concerns and partner questions."""
     lines = ["## Founder Coaching\n"]
     lines.append("Prepare for these areas before your next investor meeting:\n")
@@ -863,67 +878,67 @@ def _section_coaching(
     coaching_items: list[str] = []
 
     if score_dims is not None and not _is_stub(score_dims):
-        # Build lookup from items for evidence fallback
-        items_by_id: dict[str, dict[str, Any]] = {}
-        for it in _as_list(score_dims.get("items")):
-            if isinstance(it, dict) and it.get("id"):
-                items_by_id[it["id"]] = it
+        # Item evidence by dimension id for the fallback below — built on first use,
+        # since most scorecards have no dealbreakers (or carry evidence on them already).
+        evidence_by_id: dict[str, Any] | None = None
 
         for db in _as_list(_as_dict(score_dims.get("summary")).get("dealbreakers")):
             if not isinstance(db, dict):
                 continue
-            label = db.get("label", "?")
+            label = db.get("label") or db.get("id") or "?"
             evidence = db.get("evidence", "")
             # Fallback: if summary.dealbreakers lacks evidence, pull from items
             if not evidence:
-                dim_id = db.get("id", "")
-                fallback = items_by_id.get(dim_id, {})
-                evidence = fallback.get("evidence", "")
-            item = f"CRITICAL — **{label}**"
-            if evidence:
-                item += f": {evidence}"
-            item += " **Prepare:** Gather specific evidence to address this before your next IC."
-            coaching_items.append(item)
+                if evidence_by_id is None:
+                    evidence_by_id = {
+                        it["id"]: it.get("evidence", "")
+                        for it in _as_list(score_dims.get("items"))
+                        if isinstance(it, dict) and it.get("id")
+                    }
+                evidence = evidence_by_id.get(db.get("id", ""), "")
+            detail = f": {evidence}" if evidence else ""
+            coaching_items.append(
+                f"CRITICAL — **{label}**{detail}"
+                " **Prepare:** Gather specific evidence to address this before your next IC."
+            )
 
     if discussion is not None and not _is_stub(discussion):
         concerns = _as_list(discussion.get("key_concerns"))
-        for c in concerns:
-            coaching_items.append(f"Address this concern proactively: {c}")
+        coaching_items.extend(f"Address this concern proactively: {c}" for c in concerns)
 
     if not coaching_items:
         lines.append("No specific coaching items identified.\n")
     else:
-        for i, item in enumerate(coaching_items[:10], 1):
-            lines.append(f"{i}. {item}")
+        lines.extend(f"{i}. {item}" for i, item in enumerate(coaching_items[:10], 1))
         lines.append("")
 
-    return "\n".join(lines) + "\n"
+    return lines
 
 
-def _section_warnings(warnings: list[dict[str, str]]) -> str:
+def _section_warnings(warnings: list[dict[str, str]]) -> list[str]:
     """Validation warnings from cross-artifact checks."""
     if not warnings:
-        return ""
+        return []
 
-    sev_icons = {"high": "!!!", "medium": "!!", "acknowledged": "~", "low": "i", "info": "~"}
     lines = ["## Warnings\n"]
     for w in warnings:
         sev = w.get("severity", "?")
         code = w.get("code", "?")
         msg = w.get("message", "?")
         label = _humanize_warning(code)
-        icon = sev_icons.get(sev, "")
+        icon = _SEV_ICONS.get(sev, "")
         prefix = f"[{icon}] " if icon else ""
         lines.append(f"- {prefix}**{label}:** {msg}")
-    return "\n".join(lines) + "\n"
+    return lines
 
 
 def compose(dir_path: str) -> dict[str, Any]:
     """Main composition: load artifacts, validate, assemble report."""
     all_names = REQUIRED_ARTIFACTS + OPTIONAL_ARTIFACTS
+    present = set(os.listdir(dir_path))
     artifacts: dict[str, dict[str, Any] | None] = {}
     for name in all_names:
-        artifacts[name] = _load_artifact(dir_path, name)
+        artifacts[name] = _load_artifact(dir_path, name) if name in present else None
 
     artifacts_found = [n for n in all_names if artifacts[n] is not None and artifacts[n] is not _CORRUPT]
     artifacts_missing = [n for n in all_names if artifacts[n] is None]
@@ -938,7 +953,7 @@ def compose(dir_path: str) -> dict[str, Any]:
         for aw in _as_list(fund_art.get("accepted_warnings")):
             code = aw.get("code", "") if isinstance(aw, dict) else ""
             match_str = aw.get("match", "") if isinstance(aw, dict) else ""
-            if not code or not match_str:
+            if not code or not isinstance(match_str, str) or not match_str:
                 print("Warning: accepted_warnings entry missing 'code' or 'match' — skipped", file=sys.stderr)
                 continue
             reason = aw.get("reason", "") if isinstance(aw, dict) else ""
@@ -950,17 +965,20 @@ def compose(dir_path: str) -> dict[str, Any]:
                     {
                         "code": code,
                         "reason": reason,
-                        "match": match_str,
+                        # Matching is case-insensitive; lowercase once here, not per warning.
+                        "match": match_str.lower(),
                     }
                 )
             elif code in WARNING_SEVERITY:
                 print(f"Warning: cannot accept high-severity code '{code}' — ignored", file=sys.stderr)
-        for w in warnings:
-            for acc in acceptances:
-                if w["code"] == acc["code"] and acc["match"].lower() in w.get("message", "").lower():
-                    w["severity"] = "acknowledged"
-                    w["message"] += f" [Accepted: {acc['reason']}]"
-                    break
+        if acceptances:
+            for w in warnings:
+                message_lc = w.get("message", "").lower()
+                for acc in acceptances:
+                    if w["code"] == acc["code"] and acc["match"] in message_lc:
+                        w["severity"] = "acknowledged"
+                        w["message"] += f" [Accepted: {acc['reason']}]"
+                        break
 
     status = "clean" if not warnings else "warnings"
 
@@ -987,7 +1005,13 @@ def compose(dir_path: str) -> dict[str, Any]:
         _section_warnings(warnings),
     ]
 
-    report_markdown = "\n".join(s for s in sections if s)
+    # Sections return their lines; a "" after each non-empty one yields the blank separator line.
+    report_lines: list[str] = []
+    for section in sections:
+        if section:
+            report_lines.extend(section)
+            report_lines.append("")
+    report_markdown = "\n".join(report_lines)
     report_markdown += (
         "\n\n---\n*Generated by [founder skills](https://github.com/lool-ventures/founder-skills)"
         " by [lool ventures](https://lool.vc)"
@@ -997,16 +1021,14 @@ def compose(dir_path: str) -> dict[str, Any]:
     # Stderr summary
     print(f"Artifacts found: {len(artifacts_found)}/{len(all_names)}", file=sys.stderr)
     if warnings:
-        high = [w for w in warnings if w["severity"] == "high"]
-        medium = [w for w in warnings if w["severity"] == "medium"]
-        low = [w for w in warnings if w["severity"] == "low"]
-        info = [w for w in warnings if w["severity"] == "info"]
+        counts = Counter(w["severity"] for w in warnings)
         print(
-            f"Warnings: {len(high)} high, {len(medium)} medium, {len(low)} low, {len(info)} info",
+            f"Warnings: {counts['high']} high, {counts['medium']} medium, {counts['low']} low, {counts['info']} info",
             file=sys.stderr,
         )
+        tags = {sev: sev.upper() for sev in counts}
         for w in warnings:
-            print(f"  [{w['severity'].upper()}] {w['code']}: {w['message']}", file=sys.stderr)
+            print(f"  [{tags[w['severity']]}] {w['code']}: {w['message']}", file=sys.stderr)
     else:
         print("No warnings.", file=sys.stderr)
 
@@ -1040,14 +1062,13 @@ def main() -> None:
     result = compose(args.dir)
 
     indent = 2 if args.pretty else None
-    out = json.dumps(result, indent=indent) + "\n"
+    # backslashreplace re-escapes lone surrogates from the artifacts as \udXXX.
+    out = (json.dumps(result, indent=indent, ensure_ascii=False) + "\n").encode("utf-8", "backslashreplace")
     _write_output(out, args.output)
 
-    if args.strict:
-        blocking = [w for w in result["validation"]["warnings"] if w["severity"] in ("high", "medium")]
-        if blocking:
-            print("STRICT MODE: Exiting with code 1 due to warnings", file=sys.stderr)
-            sys.exit(1)
+    if args.strict and any(w["severity"] in ("high", "medium") for w in result["validation"]["warnings"]):
+        print("STRICT MODE: Exiting with code 1 due to warnings", file=sys.stderr)
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -28,19 +28,19 @@ import re
 import sys
 from typing import Any
 
+# Trailing legal suffix (" inc.", " llc", " ltd", " corp.", ...) stripped before matching.
+_LEGAL_SUFFIX_RE = re.compile(r"\s+(?:inc\.?|llc|ltd\.?|corp\.?)$")
+_WS_RE = re.compile(r"\s+")
+
 
 def _normalize_company(name: str) -> str:
     """Normalize company name: strip legal suffixes, lowercase, collapse whitespace."""
-    name = name.strip().lower()
-    for suffix in (" inc.", " inc", " llc", " ltd.", " ltd", " corp.", " corp"):
-        if name.endswith(suffix):
-            name = name[: -len(suffix)]
-            break
-    return re.sub(r"\s+", " ", name).strip()
+    name = _LEGAL_SUFFIX_RE.sub("", name.strip().lower(), count=1)
+    return _WS_RE.sub(" ", name).strip()
 
 
-def _write_output(data: str, output_path: str | None) -> None:
-    """Write JSON string to file or stdout."""
+def _write_output(data: bytes, output_path: str | None) -> None:
+    """Write UTF-8 encoded JSON to file or stdout."""
     if output_path:
         abs_path = os.path.abspath(output_path)
         parent = os.path.dirname(abs_path)
@@ -48,14 +48,15 @@ def _write_output(data: str, output_path: str | None) -> None:
             print(f"Error: output path resolves to root directory: {output_path}", file=sys.stderr)
             sys.exit(1)
         os.makedirs(parent, exist_ok=True)
-        with open(abs_path, "w", encoding="utf-8") as f:
+        with open(abs_path, "wb") as f:
             f.write(data)
     else:
-        sys.stdout.write(data)
+        sys.stdout.buffer.write(data)
 
 
-VALID_TYPES = {"direct", "adjacent", "customer_overlap"}
-VALID_SEVERITIES = {"blocking", "manageable"}
+VALID_TYPES = frozenset({"direct", "adjacent", "customer_overlap"})
+VALID_SEVERITIES = frozenset({"blocking", "manageable"})
+REQUIRED_CONFLICT_FIELDS = ("company", "type", "severity", "rationale")
 
 
 def validate_conflicts(data: dict[str, Any]) -> dict[str, Any]:
@@ -88,16 +89,16 @@ def validate_conflicts(data: dict[str, Any]) -> dict[str, Any]:
             deduped.append(conflict)  # let validation catch non-dict
             continue
         company = _normalize_company(conflict.get("company") or "")
-        ctype = (conflict.get("type") or "").strip().lower()
-        key = (company, ctype)
-        if company and key in seen_keys:
-            print(
-                f"Warning: duplicate conflict for '{conflict.get('company')}'"
-                f" (type: {ctype}) — keeping first occurrence",
-                file=sys.stderr,
-            )
-            continue
-        if company:
+        if company:  # entries without a company are never deduplicated
+            ctype = (conflict.get("type") or "").strip().lower()
+            key = (company, ctype)
+            if key in seen_keys:
+                print(
+                    f"Warning: duplicate conflict for '{conflict.get('company')}'"
+                    f" (type: {ctype}) — keeping first occurrence",
+                    file=sys.stderr,
+                )
+                continue
             seen_keys.add(key)
         deduped.append(conflict)
     conflicts = deduped
@@ -111,21 +112,18 @@ def validate_conflicts(data: dict[str, Any]) -> dict[str, Any]:
             continue
 
         # Required fields per conflict
-        for field in ["company", "type", "severity", "rationale"]:
+        for field in REQUIRED_CONFLICT_FIELDS:
             if not conflict.get(field):
                 errors.append(f"Conflict {i}: missing required field '{field}'")
 
-        # Type enum
+        # Enums — a valid entry costs exactly two set probes
         ctype = conflict.get("type", "")
+        severity = conflict.get("severity", "")
         if ctype not in VALID_TYPES:
             errors.append(f"Conflict {i}: invalid type '{ctype}'. Must be one of: {sorted(VALID_TYPES)}")
-
-        # Severity enum
-        severity = conflict.get("severity", "")
         if severity not in VALID_SEVERITIES:
             errors.append(f"Conflict {i}: invalid severity '{severity}'. Must be one of: {sorted(VALID_SEVERITIES)}")
-
-        if severity == "blocking":
+        elif severity == "blocking":
             has_blocking = True
 
     # portfolio_size must be >= len(conflicts)
@@ -180,8 +178,8 @@ def main() -> None:
         sys.exit(1)
 
     try:
-        data = json.load(sys.stdin)
-    except json.JSONDecodeError as e:
+        data = json.loads(sys.stdin.buffer.read())
+    except ValueError as e:  # JSONDecodeError or undecodable bytes
         print(f"Error: invalid JSON input: {e}", file=sys.stderr)
         sys.exit(1)
 
@@ -192,7 +190,7 @@ def main() -> None:
     result = validate_conflicts(data)
 
     indent = 2 if args.pretty else None
-    out = json.dumps(result, indent=indent) + "\n"
+    out = (json.dumps(result, indent=indent, ensure_ascii=False) + "\n").encode("utf-8", "backslashreplace")
     _write_output(out, args.output)
 
 
@@ -28,8 +28,8 @@ import sys
 from typing import Any
 
 
-def _write_output(data: str, output_path: str | None) -> None:
-    """Write JSON string to file or stdout."""
+def _write_output(data: bytes, output_path: str | None) -> None:
+    """Write UTF-8 encoded JSON to file or stdout."""
     if output_path:
         abs_path = os.path.abspath(output_path)
         parent = os.path.dirname(abs_path)
@@ -37,10 +37,10 @@ def _write_output(data: str, output_path: str | None) -> None:
             print(f"Error: output path resolves to root directory: {output_path}", file=sys.stderr)
             sys.exit(1)
         os.makedirs(parent, exist_ok=True)
-        with open(abs_path, "w", encoding="utf-8") as f:
+        with open(abs_path, "wb") as f:
             f.write(data)
     else:
-        sys.stdout.write(data)
+        sys.stdout.buffer.write(data)
 
 
 VALID_ROLES = {"visionary", "operator", "analyst"}
@@ -169,8 +169,8 @@ def main() -> None:
         sys.exit(1)
 
     try:
-        data = json.load(sys.stdin)
-    except json.JSONDecodeError as e:
+        data = json.loads(sys.stdin.buffer.read())
+    except ValueError as e:  # JSONDecodeError or undecodable bytes
         print(f"Error: invalid JSON input: {e}", file=sys.stderr)
         sys.exit(1)
 
@@ -181,7 +181,7 @@ def main() -> None:
     result = validate_fund_profile(data)
 
     indent = 2 if args.pretty else None
-    out = json.dumps(result, indent=indent) + "\n"
+    out = (json.dumps(result, indent=indent, ensure_ascii=False) + "\n").encode("utf-8", "backslashreplace")
     _write_output(out, args.output)
 
 
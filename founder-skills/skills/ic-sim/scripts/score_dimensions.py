@@ -24,11 +24,12 @@ import argparse
 import json
 import os
 import sys
+from collections import Counter
 from typing import Any
 
 
-def _write_output(data: str, output_path: str | None) -> None:
-    """Write JSON string to file or stdout."""
+def _write_output(data: bytes, output_path: str | None) -> None:
+    """Write UTF-8 encoded JSON to file or stdout."""
     if output_path:
         abs_path = os.path.abspath(output_path)
         parent = os.path.dirname(abs_path)
@@ -36,10 +37,10 @@ def _write_output(data: str, output_path: str | None) -> None:
             print(f"Error: output path resolves to root directory: {output_path}", file=sys.stderr)
             sys.exit(1)
         os.makedirs(parent, exist_ok=True)
-        with open(abs_path, "w", encoding="utf-8") as f:
+        with open(abs_path, "wb") as f:
             f.write(data)
     else:
-        sys.stdout.write(data)
+        sys.stdout.buffer.write(data)
 
 
 # Canonical 28 dimensions grouped by category.
@@ -81,15 +82,36 @@ DIMENSION_ITEMS: list[dict[str, str]] = [
     {"id": "fit_value_add", "category": "Fund Fit", "label": "Value-Add Potential"},
 ]
 
-VALID_IDS = {item["id"] for item in DIMENSION_ITEMS}
-VALID_STATUSES = {"strong_conviction", "moderate_conviction", "concern", "dealbreaker", "not_applicable"}
-ITEM_LOOKUP = {item["id"]: item for item in DIMENSION_ITEMS}
+VALID_IDS = frozenset(item["id"] for item in DIMENSION_ITEMS)
+STATUS_ORDER = ("strong_conviction", "moderate_conviction", "concern", "dealbreaker", "not_applicable")
+VALID_STATUSES = frozenset(STATUS_ORDER)
+CATEGORY_NAMES = tuple(dict.fromkeys(item["category"] for item in DIMENSION_ITEMS))
+_ZERO_CATEGORY_COUNTS = dict.fromkeys(STATUS_ORDER, 0)
+# Enriched-item skeletons; copied per item, then the input fields are filled in.
+_ENRICHED_TEMPLATES: dict[str, dict[str, Any]] = {
+    item["id"]: {
+        "id": item["id"],
+        "category": item["category"],
+        "label": item["label"],
+        "status": None,
+        "evidence": None,
+        "notes": None,
+    }
+    for item in DIMENSION_ITEMS
+}
 
 
 def validate_dimensions(items: list[dict[str, Any]]) -> dict[str, Any]:
     """Validate dimension input and produce scored summary."""
     errors: list[str] = []
     seen_ids: set[str] = set()
+    enriched: list[dict[str, Any]] = []
+    dealbreakers: list[dict[str, Any]] = []
+    top_concerns: list[dict[str, Any]] = []
+    flagged_by_status = {"concern": top_concerns, "dealbreaker": dealbreakers}
+
+    # Validate and enrich in one pass; enrichment stops at the first error
+    # since an invalid payload discards it anyway.
     for item in items:
         if not isinstance(item, dict):
             errors.append(f"Item {len(seen_ids)} must be an object (got {type(item).__name__})")
@@ -105,85 +127,47 @@ def validate_dimensions(items: list[dict[str, Any]]) -> dict[str, Any]:
         if status not in VALID_STATUSES:
             errors.append(f"Invalid status '{status}' for '{item_id}'")
 
-    missing = VALID_IDS - seen_ids
-    if missing:
-        errors.append(f"Missing dimensions: {sorted(missing)}")
-
-    if errors:
-        return {"items": [], "summary": {}, "validation": {"status": "invalid", "errors": errors}}
-
-    # Build enriched items and summary
-    enriched: list[dict[str, Any]] = []
-    strong_count = 0
-    moderate_count = 0
-    concern_count = 0
-    dealbreaker_count = 0
-    na_count = 0
-    dealbreakers: list[dict[str, Any]] = []
-    top_concerns: list[dict[str, Any]] = []
-
-    # Per-category tracking
-    categories: dict[str, dict[str, int]] = {}
+        if errors:
+            continue
 
-    for item in items:
-        item_id = item["id"]
-        meta = ITEM_LOOKUP[item_id]
-        status = item["status"]
         evidence = item.get("evidence")
         notes = item.get("notes")
-        category = meta["category"]
-
-        enriched.append(
-            {
-                "id": item_id,
-                "category": category,
-                "label": meta["label"],
-                "status": status,
-                "evidence": evidence,
-                "notes": notes,
-            }
-        )
 
-        # Initialize category counters
-        if category not in categories:
-            categories[category] = {
-                "strong_conviction": 0,
-                "moderate_conviction": 0,
-                "concern": 0,
-                "dealbreaker": 0,
-                "not_applicable": 0,
-            }
-
-        categories[category][status] += 1
-
-        if status == "strong_conviction":
-            strong_count += 1
-        elif status == "moderate_conviction":
-            moderate_count += 1
-        elif status == "concern":
-            concern_count += 1
-            top_concerns.append(
-                {
-                    "id": item_id,
-                    "category": category,
-                    "label": meta["label"],
-                    "evidence": evidence,
-                    "notes": notes,
-                }
-            )
-        elif status == "dealbreaker":
-            dealbreaker_count += 1
-            dealbreakers.append(
+        entry = _ENRICHED_TEMPLATES[item_id].copy()
+        entry["status"] = status
+        entry["evidence"] = evidence
+        entry["notes"] = notes
+        enriched.append(entry)
+
+        flagged = flagged_by_status.get(status)
+        if flagged is not None:
+            flagged.append(
                 {
-                    "id": item_id,
-                    "category": category,
-                    "label": meta["label"],
+                    "id": entry["id"],
+                    "category": entry["category"],
+                    "label": entry["label"],
                     "evidence": evidence,
                     "notes": notes,
                 }
             )
-        elif status == "not_applicable":
-            na_count += 1
+
+    missing = [dim["id"] for dim in DIMENSION_ITEMS if dim["id"] not in seen_ids]
+    if missing:
+        errors.append(f"Missing dimensions: {missing}")
+
+    if errors:
+        return {"items": [], "summary": {}, "validation": {"status": "invalid", "errors": errors}}
+
+    # Overall and per-category counts (categories in canonical order)
+    status_counts = Counter(item["status"] for item in enriched)
+    categories: dict[str, dict[str, int]] = {category: _ZERO_CATEGORY_COUNTS.copy() for category in CATEGORY_NAMES}
+    for (category, status), count in Counter((item["category"], item["status"]) for item in enriched).items():
+        categories[category][status] = count
+    strong_count = status_counts["strong_conviction"]
+    moderate_count = status_counts["moderate_conviction"]
+    concern_count = status_counts["concern"]
+    dealbreaker_count = status_counts["dealbreaker"]
+    na_count = status_counts["not_applicable"]
 
     applicable = len(DIMENSION_ITEMS) - na_count
     warnings: list[str] = []
@@ -246,8 +230,8 @@ def main() -> None:
         sys.exit(1)
 
     try:
-        data = json.load(sys.stdin)
-    except json.JSONDecodeError as e:
+        data = json.loads(sys.stdin.buffer.read())
+    except ValueError as e:  # JSONDecodeError or undecodable bytes
         print(f"Error: invalid JSON input: {e}", file=sys.stderr)
         sys.exit(1)
 
@@ -261,9 +245,12 @@ def main() -> None:
 
     result = validate_dimensions(data["items"])
 
-    indent = 2 if args.pretty else None
-    out = json.dumps(result, indent=indent) + "\n"
-    _write_output(out, args.output)
+    if args.pretty:
+        out = json.dumps(result, indent=2, ensure_ascii=False)
+    else:
+        out = json.dumps(result, separators=(",", ":"), ensure_ascii=False)
+    # backslashreplace turns lone surrogates (legal JSON escapes) back into \udXXX escapes.
+    _write_output((out + "\n").encode("utf-8", "backslashreplace"), args.output)
 
 
 if __name__ == "__main__":
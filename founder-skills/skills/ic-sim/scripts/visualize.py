@@ -48,14 +48,18 @@ OPTIONAL_ARTIFACTS = [
 
 
 def _load_artifact(dir_path: str, name: str) -> dict[str, Any] | None:
-    """Load a JSON artifact. Returns None if missing, _CORRUPT if unparseable."""
+    """Load a JSON artifact. Returns None if missing, _CORRUPT if unparseable or not UTF-8.
+
+    Callers skip names absent from a single os.listdir() of the directory rather
+    than probing each file; FileNotFoundError still maps to None.
+    """
     path = os.path.join(dir_path, name)
-    if not os.path.exists(path):
-        return None
     try:
-        with open(path, encoding="utf-8") as f:
-            return json.load(f)  # type: ignore[no-any-return]
-    except (json.JSONDecodeError, OSError):
+        with open(path, "rb") as f:
+            return json.loads(f.read())  # type: ignore[no-any-return]
+    except FileNotFoundError:
+        return None
+    except (ValueError, OSError):
         return _CORRUPT
 
 
@@ -70,13 +74,13 @@ def _usable(data: dict[str, Any] | None) -> TypeGuard[dict[str, Any]]:
 
 
 def _as_list(value: Any) -> list[Any]:
-    """Coerce to list -- returns [] if not a list."""
-    return value if isinstance(value, list) else []
+    """Coerce to list -- returns [] if not a list (json.loads never yields list subclasses)."""
+    return value if type(value) is list else []
 
 
 def _as_dict(value: Any) -> dict[str, Any]:
-    """Coerce to dict -- returns {} if not a dict."""
-    return value if isinstance(value, dict) else {}
+    """Coerce to dict -- returns {} if not a dict (json.loads never yields dict subclasses)."""
+    return value if type(value) is dict else {}
 
 
 # ---------------------------------------------------------------------------
@@ -91,6 +95,11 @@ def _esc(text: Any) -> str:
 
 def _num(value: Any, default: float = 0.0) -> float:
     """Coerce to finite float, returning default for non-numeric / non-finite."""
+    # Fast paths for the common JSON shapes: integer counts and absent keys.
+    if type(value) is int:
+        return float(value)
+    if value is None:
+        return default
     try:
         result = float(value)
         if not math.isfinite(result):
@@ -100,6 +109,11 @@ def _num(value: Any, default: float = 0.0) -> float:
         return default
 
 
+def _clamp(value: float, lo: float, hi: float) -> float:
+    """Clamp a finite float to [lo, hi] (same result as max(lo, min(hi, value)))."""
+    return lo if value <= lo else hi if value >= hi else value
+
+
 def _smart_truncate(text: str, max_len: int = 250) -> str:
     """Truncate text at sentence boundary within max_len, falling back to word boundary."""
     if len(text) <= max_len:
@@ -118,6 +132,11 @@ def _smart_truncate(text: str, max_len: int = 250) -> str:
     return text[: max_len - 3] + "..."
 
 
+def _verdict_label(verdict: str) -> str:
+    """Display label for a normalized verdict, title-casing unknown values."""
+    return _VERDICT_LABELS.get(verdict) or verdict.replace("_", " ").title()
+
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
@@ -132,8 +151,17 @@ _CANONICAL_CATEGORIES = [
     "Fund Fit",
 ]
 
+_CANONICAL_CATEGORY_SET = frozenset(_CANONICAL_CATEGORIES)
+
+# Pre-escaped canonical category names; unknown categories are escaped on use.
+_ESC_CATEGORIES = {cat: _esc(cat) for cat in _CANONICAL_CATEGORIES}
+
 _CANONICAL_PARTNERS = ["visionary", "operator", "analyst"]
 
+_CANONICAL_PARTNER_SET = frozenset(_CANONICAL_PARTNERS)
+
+# Palette values are fixed "#rrggbb" literals (and every lookup falls back to
+# another literal), so they are interpolated into markup without escaping.
 _VERDICT_COLORS: dict[str, str] = {
     "invest": "#10b981",
     "more_diligence": "#f59e0b",
@@ -149,6 +177,23 @@ _STATUS_COLORS: dict[str, str] = {
     "not_applicable": "#9ca3af",
 }
 
+# Display labels for the known verdicts ("more_diligence" -> "More Diligence").
+_VERDICT_LABELS = {verdict: verdict.replace("_", " ").title() for verdict in _VERDICT_COLORS}
+
+# Stacking order and legend labels for the category breakdown bars.
+_STATUS_ORDER = ("strong_conviction", "moderate_conviction", "concern", "dealbreaker", "not_applicable")
+
+_STATUS_LABELS: dict[str, str] = {
+    "strong_conviction": "Strong",
+    "moderate_conviction": "Moderate",
+    "concern": "Concern",
+    "dealbreaker": "Dealbreaker",
+    "not_applicable": "N/A",
+}
+
+# Pre-escaped legend labels (cf. _ESC_CATEGORIES); raw labels still size the legend.
+_ESC_STATUS_LABELS = {status: _esc(label) for status, label in _STATUS_LABELS.items()}
+
 _SEVERITY_COLORS: dict[str, str] = {
     "clear": "#10b981",
     "manageable": "#f59e0b",
@@ -247,6 +292,13 @@ def _artifact_placeholder(
 # ---------------------------------------------------------------------------
 
 
+# Zone boundaries at 50% and 75% are fixed points on the unit semi-circle.
+_GAUGE_Z50_COS = math.cos(math.pi * (1.0 - 0.5))
+_GAUGE_Z50_SIN = math.sin(math.pi * (1.0 - 0.5))
+_GAUGE_Z75_COS = math.cos(math.pi * (1.0 - 0.75))
+_GAUGE_Z75_SIN = math.sin(math.pi * (1.0 - 0.75))
+
+
 def _chart_conviction_gauge(score_dims: dict[str, Any] | None) -> str:
     """Render semi-circle conviction gauge SVG."""
     ph = _artifact_placeholder(score_dims, "Score dimensions")
@@ -258,7 +310,7 @@ def _chart_conviction_gauge(score_dims: dict[str, Any] | None) -> str:
     verdict = str(summary.get("verdict", "unknown")).strip().lower()
 
     # Clamp 0-100
-    conviction = max(0.0, min(100.0, conviction))
+    conviction = _clamp(conviction, 0.0, 100.0)
 
     # SVG parameters
     cx, cy, r = 150.0, 130.0, 100.0
@@ -272,13 +324,10 @@ def _chart_conviction_gauge(score_dims: dict[str, Any] | None) -> str:
     end_y = cy - r * math.sin(score_angle)
 
     # Zone boundaries: 50% and 75%
-    z50_angle = math.pi * (1.0 - 0.5)
-    z75_angle = math.pi * (1.0 - 0.75)
-
-    z50_x = cx + r * math.cos(z50_angle)
-    z50_y = cy - r * math.sin(z50_angle)
-    z75_x = cx + r * math.cos(z75_angle)
-    z75_y = cy - r * math.sin(z75_angle)
+    z50_x = cx + r * _GAUGE_Z50_COS
+    z50_y = cy - r * _GAUGE_Z50_SIN
+    z75_x = cx + r * _GAUGE_Z75_COS
+    z75_y = cy - r * _GAUGE_Z75_SIN
 
     # Start of arc (left)
     start_x = cx - r
@@ -289,7 +338,7 @@ def _chart_conviction_gauge(score_dims: dict[str, Any] | None) -> str:
     arc_end_y = cy
 
     verdict_color = _VERDICT_COLORS.get(verdict, "#9ca3af")
-    verdict_label = _esc(verdict.replace("_", " ").title())
+    verdict_label = _esc(_verdict_label(verdict))
 
     # Large arc flag for score fill
     large_arc = 1 if score_frac > 0.5 else 0
@@ -313,14 +362,14 @@ def _chart_conviction_gauge(score_dims: dict[str, Any] | None) -> str:
         svg_parts.append(
             f'<path d="M {start_x:.2f} {start_y:.2f} A {r:.2f} {r:.2f} 0'
             f' {large_arc} 1 {end_x:.2f} {end_y:.2f}"'
-            f' fill="none" stroke="{_esc(verdict_color)}" stroke-width="18"'
+            f' fill="none" stroke="{verdict_color}" stroke-width="18"'
             f' stroke-linecap="round"/>'
         )
 
     # Score text
     svg_parts.append(
         f'<text x="{cx:.2f}" y="{cy - 15:.2f}" text-anchor="middle"'
-        f' font-size="36" font-weight="bold" fill="{_esc(verdict_color)}">'
+        f' font-size="36" font-weight="bold" fill="{verdict_color}">'
         f"{conviction:.1f}</text>"
     )
     # Verdict label
@@ -343,40 +392,47 @@ def _chart_conviction_gauge(score_dims: dict[str, Any] | None) -> str:
 # ---------------------------------------------------------------------------
 
 
-def _category_weighted_score(by_cat: dict[str, Any], cat: str) -> float:
+def _category_rows(score_dims: dict[str, Any] | None) -> list[tuple[str, dict[str, float]]]:
+    """Ordered (category, numeric status counts) rows shared by the radar and bar charts.
+
+    Canonical categories come first, then any unknown categories alphabetically.
+    """
+    if not _usable(score_dims):
+        return []
+    by_cat = _as_dict(_as_dict(score_dims.get("summary")).get("by_category"))
+    categories = list(_CANONICAL_CATEGORIES)
+    categories.extend(sorted(by_cat.keys() - _CANONICAL_CATEGORY_SET))
+    rows: list[tuple[str, dict[str, float]]] = []
+    for cat in categories:
+        raw = _as_dict(by_cat.get(cat))
+        rows.append((cat, {status: _num(raw.get(status), 0.0) for status in _STATUS_ORDER}))
+    return rows
+
+
+def _category_weighted_score(counts: dict[str, float]) -> float:
     """Compute weighted score for a category: strong=1.0, moderate=0.5, others=0."""
-    counts = _as_dict(by_cat.get(cat))
-    strong = _num(counts.get("strong_conviction"), 0.0)
-    moderate = _num(counts.get("moderate_conviction"), 0.0)
-    concern = _num(counts.get("concern"), 0.0)
-    db = _num(counts.get("dealbreaker"), 0.0)
-    na = _num(counts.get("not_applicable"), 0.0)
-    applicable = strong + moderate + concern + db
+    strong = counts["strong_conviction"]
+    moderate = counts["moderate_conviction"]
+    applicable = strong + moderate + counts["concern"] + counts["dealbreaker"]
     if applicable <= 0:
         # All N/A or empty
-        if na > 0:
-            return 0.0
         return 0.0
     weighted = strong * 1.0 + moderate * 0.5
     return round(weighted / applicable * 100.0, 2)
 
 
-def _chart_category_radar(score_dims: dict[str, Any] | None) -> str:
+def _chart_category_radar(
+    score_dims: dict[str, Any] | None,
+    rows: list[tuple[str, dict[str, float]]],
+) -> str:
     """Render 7-point radar/spider chart SVG."""
     ph = _artifact_placeholder(score_dims, "Score dimensions")
     if ph is not None:
         return f'<div class="chart-box"><h2>Category Radar</h2>{ph}</div>'
 
-    summary = _as_dict(score_dims.get("summary"))  # type: ignore[union-attr]
-    by_cat = _as_dict(summary.get("by_category"))
-
     # Ordered categories with their scores
-    categories = list(_CANONICAL_CATEGORIES)
-    # Append any unknown categories alphabetically
-    extra = sorted(set(by_cat.keys()) - set(categories))
-    categories.extend(extra)
-
-    scores = [_category_weighted_score(by_cat, cat) for cat in categories]
+    categories = [cat for cat, _ in rows]
+    scores = [_category_weighted_score(counts) for _, counts in rows]
     n = len(categories)
     if n == 0:
         return f'<div class="chart-box"><h2>Category Radar</h2>{_placeholder("No categories")}</div>'
@@ -387,26 +443,25 @@ def _chart_category_radar(score_dims: dict[str, Any] | None) -> str:
 
     svg_lines: list[str] = ['<svg viewBox="0 0 460 330" xmlns="http://www.w3.org/2000/svg">']
 
-    # Angle offset: start from top (-90 degrees)
-    def _angle(i: int) -> float:
-        return 2 * math.pi * i / n - math.pi / 2
+    # Angle offset: start from top (-90 degrees); trig computed once per axis
+    angles = [2 * math.pi * i / n - math.pi / 2 for i in range(n)]
+    cos_a = [math.cos(a) for a in angles]
+    sin_a = [math.sin(a) for a in angles]
 
     # Draw grid rings at 25%, 50%, 75%, 100%
     for pct in [0.25, 0.5, 0.75, 1.0]:
         ring_r = max_r * pct
         points = []
         for i in range(n):
-            a = _angle(i)
-            px = cx + ring_r * math.cos(a)
-            py = cy + ring_r * math.sin(a)
+            px = cx + ring_r * cos_a[i]
+            py = cy + ring_r * sin_a[i]
             points.append(f"{px:.2f},{py:.2f}")
         svg_lines.append(f'<polygon points="{" ".join(points)}" fill="none" stroke="#334155" stroke-width="0.5"/>')
 
     # Draw axis lines
     for i in range(n):
-        a = _angle(i)
-        ex = cx + max_r * math.cos(a)
-        ey = cy + max_r * math.sin(a)
+        ex = cx + max_r * cos_a[i]
+        ey = cy + max_r * sin_a[i]
         svg_lines.append(
             f'<line x1="{cx:.2f}" y1="{cy:.2f}" x2="{ex:.2f}" y2="{ey:.2f}" stroke="#334155" stroke-width="0.5"/>'
         )
@@ -415,11 +470,10 @@ def _chart_category_radar(score_dims: dict[str, Any] | None) -> str:
     data_points: list[str] = []
     point_coords: list[tuple[float, float, float]] = []  # (px, py, score)
     for i in range(n):
-        a = _angle(i)
         frac = _num(scores[i], 0.0) / 100.0
-        frac = max(0.05, min(1.0, frac))  # 5% floor prevents center collapse
-        px = cx + max_r * frac * math.cos(a)
-        py = cy + max_r * frac * math.sin(a)
+        frac = _clamp(frac, 0.05, 1.0)  # 5% floor prevents center collapse
+        px = cx + max_r * frac * cos_a[i]
+        py = cy + max_r * frac * sin_a[i]
         data_points.append(f"{px:.2f},{py:.2f}")
         point_coords.append((px, py, scores[i]))
 
@@ -433,14 +487,13 @@ def _chart_category_radar(score_dims: dict[str, Any] | None) -> str:
         px, py, score_val = point_coords[i]
         svg_lines.append(f'<circle cx="{px:.2f}" cy="{py:.2f}" r="3" fill="#21a2e3"/>')
         # Score label near each data point (offset outward slightly)
-        a = _angle(i)
         label_offset = 12.0
-        lx = px + label_offset * math.cos(a)
-        ly = py + label_offset * math.sin(a)
+        lx = px + label_offset * cos_a[i]
+        ly = py + label_offset * sin_a[i]
         anchor = "middle"
-        if math.cos(a) > 0.3:
+        if cos_a[i] > 0.3:
             anchor = "start"
-        elif math.cos(a) < -0.3:
+        elif cos_a[i] < -0.3:
             anchor = "end"
         svg_lines.append(
             f'<text x="{lx:.2f}" y="{ly:.2f}" text-anchor="{anchor}"'
@@ -450,20 +503,19 @@ def _chart_category_radar(score_dims: dict[str, Any] | None) -> str:
 
     # Labels
     for i in range(n):
-        a = _angle(i)
         label_r = max_r + 20
-        lx = cx + label_r * math.cos(a)
-        ly = cy + label_r * math.sin(a)
+        lx = cx + label_r * cos_a[i]
+        ly = cy + label_r * sin_a[i]
         anchor = "middle"
-        if math.cos(a) > 0.3:
+        if cos_a[i] > 0.3:
             anchor = "start"
-        elif math.cos(a) < -0.3:
+        elif cos_a[i] < -0.3:
             anchor = "end"
         score_str = f"{scores[i]:.0f}%"
         svg_lines.append(
             f'<text x="{lx:.2f}" y="{ly:.2f}" text-anchor="{anchor}"'
             f' font-size="10" fill="#94a3b8">'
-            f"{_esc(categories[i])}</text>"
+            f"{_ESC_CATEGORIES.get(categories[i]) or _esc(categories[i])}</text>"
         )
         svg_lines.append(
             f'<text x="{lx:.2f}" y="{ly + 12:.2f}" text-anchor="{anchor}"'
@@ -484,67 +536,47 @@ def _chart_category_radar(score_dims: dict[str, Any] | None) -> str:
 # ---------------------------------------------------------------------------
 
 
-def _chart_category_bars(score_dims: dict[str, Any] | None) -> str:
+def _chart_category_bars(
+    score_dims: dict[str, Any] | None,
+    rows: list[tuple[str, dict[str, float]]],
+) -> str:
     """Render horizontal stacked bar chart SVG for category breakdowns."""
     ph = _artifact_placeholder(score_dims, "Score dimensions")
     if ph is not None:
         return f'<div class="chart-box full"><h2>Category Breakdown</h2>{ph}</div>'
 
-    summary = _as_dict(score_dims.get("summary"))  # type: ignore[union-attr]
-    by_cat = _as_dict(summary.get("by_category"))
-
-    categories = list(_CANONICAL_CATEGORIES)
-    extra = sorted(set(by_cat.keys()) - set(categories))
-    categories.extend(extra)
-
     bar_height = 24.0
     bar_gap = 8.0
     label_width = 110.0
     bar_width = 400.0
     y_start = 10.0
-    total_height = y_start + len(categories) * (bar_height + bar_gap) + 40
+    total_height = y_start + len(rows) * (bar_height + bar_gap) + 40
     total_w = label_width + bar_width + 30
 
     svg_lines: list[str] = [f'<svg viewBox="0 0 {total_w:.0f} {total_height:.0f}" xmlns="http://www.w3.org/2000/svg">']
 
-    status_order = [
-        "strong_conviction",
-        "moderate_conviction",
-        "concern",
-        "dealbreaker",
-        "not_applicable",
-    ]
-    status_labels = {
-        "strong_conviction": "Strong",
-        "moderate_conviction": "Moderate",
-        "concern": "Concern",
-        "dealbreaker": "Dealbreaker",
-        "not_applicable": "N/A",
-    }
-
-    for ci, cat in enumerate(categories):
-        counts = _as_dict(by_cat.get(cat))
-        total = sum(_num(counts.get(s), 0.0) for s in status_order)
+    for ci, (cat, counts) in enumerate(rows):
+        total = sum(counts.values())
         y = y_start + ci * (bar_height + bar_gap)
 
         # Category label
         svg_lines.append(
             f'<text x="{label_width - 8:.2f}" y="{y + bar_height / 2 + 4:.2f}"'
             f' text-anchor="end" font-size="11" fill="#e2e8f0">'
-            f"{_esc(cat)}</text>"
+            f"{_ESC_CATEGORIES.get(cat) or _esc(cat)}</text>"
         )
 
         # Stacked segments
         x_offset = label_width
-        for status in status_order:
-            count = _num(counts.get(status), 0.0)
+        for status in _STATUS_ORDER:
+            count = counts[status]
             if total > 0 and count > 0:
                 seg_w = (count / total) * bar_width
                 color = _STATUS_COLORS.get(status, "#9ca3af")
                 svg_lines.append(
                     f'<rect x="{x_offset:.2f}" y="{y:.2f}"'
                     f' width="{seg_w:.2f}" height="{bar_height:.2f}"'
-                    f' fill="{_esc(color)}" rx="2"/>'
+                    f' fill="{color}" rx="2"/>'
                 )
                 # Count label inside bar if segment is wide enough
                 if seg_w > 20:
@@ -557,14 +589,15 @@ def _chart_category_bars(score_dims: dict[str, Any] | None) -> str:
                 x_offset += seg_w
 
     # Legend
-    legend_y = y_start + len(categories) * (bar_height + bar_gap) + 10
+    legend_y = y_start + len(rows) * (bar_height + bar_gap) + 10
     lx = label_width
-    for status in status_order:
+    for status in _STATUS_ORDER:
         color = _STATUS_COLORS.get(status, "#9ca3af")
-        label = status_labels.get(status, status)
-        svg_lines.append(f'<rect x="{lx:.2f}" y="{legend_y:.2f}" width="10" height="10" fill="{_esc(color)}" rx="2"/>')
+        label = _STATUS_LABELS[status]
+        svg_lines.append(f'<rect x="{lx:.2f}" y="{legend_y:.2f}" width="10" height="10" fill="{color}" rx="2"/>')
         svg_lines.append(
-            f'<text x="{lx + 14:.2f}" y="{legend_y + 9:.2f}" font-size="9" fill="#94a3b8">{_esc(label)}</text>'
+            f'<text x="{lx + 14:.2f}" y="{legend_y + 9:.2f}" font-size="9" fill="#94a3b8">'
+            f"{_ESC_STATUS_LABELS[status]}</text>"
         )
         lx += len(label) * 6.5 + 24
 
@@ -596,7 +629,7 @@ def _chart_partner_verdicts(discussion: dict[str, Any] | None) -> str:
 
     # Build ordered list: canonical partners first, then any extras alphabetically
     ordered_partners = list(_CANONICAL_PARTNERS)
-    extra = sorted(set(by_partner.keys()) - set(ordered_partners))
+    extra = sorted(by_partner.keys() - _CANONICAL_PARTNER_SET)
     ordered_partners.extend(extra)
 
     cards: list[str] = []
@@ -614,14 +647,14 @@ def _chart_partner_verdicts(discussion: dict[str, Any] | None) -> str:
         verdict = str(pv.get("verdict", "unknown")).strip().lower()
         rationale = str(pv.get("rationale", ""))
         color = _VERDICT_COLORS.get(verdict, "#9ca3af")
-        verdict_label = _esc(verdict.replace("_", " ").title())
+        verdict_label = _esc(_verdict_label(verdict))
 
         rationale = _smart_truncate(rationale)
 
         cards.append(
-            f'<div class="partner-card" style="border-color: {_esc(color)};">'
+            f'<div class="partner-card" style="border-color: {color};">'
             f"<h3>{_esc(partner.title())}</h3>"
-            f'<div class="verdict" style="color: {_esc(color)};">'
+            f'<div class="verdict" style="color: {color};">'
             f"{verdict_label}</div>"
             f'<div class="rationale">{_esc(rationale)}</div>'
             f"</div>"
@@ -651,7 +684,7 @@ def _chart_conflict_summary(conflict: dict[str, Any] | None) -> str:
     severity = str(summary.get("overall_severity", "unknown")).strip().lower()
     badge_color = _SEVERITY_COLORS.get(severity, "#9ca3af")
 
-    parts: list[str] = [f'<span class="badge" style="background: {_esc(badge_color)};">{_esc(severity.title())}</span>']
+    parts: list[str] = [f'<span class="badge" style="background: {badge_color};">{_esc(severity.title())}</span>']
 
     conflicts = _as_list(conflict.get("conflicts"))  # type: ignore[union-attr]
     if conflicts:
@@ -664,9 +697,7 @@ def _chart_conflict_summary(conflict: dict[str, Any] | None) -> str:
             csev = str(c.get("severity", "?")).strip().lower()
             csev_color = _SEVERITY_COLORS.get(csev, "#9ca3af")
             rows.append(
-                f"<tr><td>{company}</td><td>{ctype}</td>"
-                f'<td style="color: {_esc(csev_color)};">'
-                f"{_esc(csev.title())}</td></tr>"
+                f'<tr><td>{company}</td><td>{ctype}</td><td style="color: {csev_color};">{_esc(csev.title())}</td></tr>'
             )
         parts.append(
             '<table class="conflict-table">'
@@ -712,7 +743,7 @@ def _section_summary_bar(
             if not name:
                 continue
             color = _VERDICT_COLORS.get(verdict, "#9ca3af")
-            label = verdict.replace("_", " ").title()
+            label = _verdict_label(verdict)
             verdict_spans.append(f'<span style="color:{color};">{_esc(name)}: {_esc(label)}</span>')
         if verdict_spans:
             parts.append(f'<div style="font-size:0.85rem;margin-top:0.25rem;">{" · ".join(verdict_spans)}</div>')
@@ -750,9 +781,10 @@ def _section_summary_bar(
 def compose_html(dir_path: str) -> str:
     """Load artifacts and compose the full HTML document."""
     all_names = REQUIRED_ARTIFACTS + OPTIONAL_ARTIFACTS
+    present = set(os.listdir(dir_path))
     artifacts: dict[str, dict[str, Any] | None] = {}
     for name in all_names:
-        artifacts[name] = _load_artifact(dir_path, name)
+        artifacts[name] = _load_artifact(dir_path, name) if name in present else None
 
     startup = artifacts.get("startup_profile.json")
     score_dims = artifacts.get("score_dimensions.json")
@@ -782,8 +814,9 @@ def compose_html(dir_path: str) -> str:
 
     # Charts
     gauge = _chart_conviction_gauge(score_dims)
-    radar = _chart_category_radar(score_dims)
-    bars = _chart_category_bars(score_dims)
+    category_rows = _category_rows(score_dims)
+    radar = _chart_category_radar(score_dims, category_rows)
+    bars = _chart_category_bars(score_dims, category_rows)
     partners = _chart_partner_verdicts(discussion)
     conflicts = _chart_conflict_summary(conflict)
 
@@ -830,8 +863,8 @@ def compose_html(dir_path: str) -> str:
 # ---------------------------------------------------------------------------
 
 
-def _write_output(data: str, output_path: str | None) -> None:
-    """Write HTML string to file or stdout."""
+def _write_output(data: bytes, output_path: str | None) -> None:
+    """Write UTF-8 encoded HTML to file or stdout."""
     if output_path:
         abs_path = os.path.abspath(output_path)
         parent = os.path.dirname(abs_path)
@@ -842,10 +875,10 @@ def _write_output(data: str, output_path: str | None) -> None:
             )
             sys.exit(1)
         os.makedirs(parent, exist_ok=True)
-        with open(abs_path, "w", encoding="utf-8") as f:
+        with open(abs_path, "wb") as f:
             f.write(data)
     else:
-        sys.stdout.write(data)
+        sys.stdout.buffer.write(data)
 
 
 # ---------------------------------------------------------------------------
@@ -884,7 +917,7 @@ def main() -> None:
         sys.exit(1)
 
     html_out = compose_html(args.dir)
-    _write_output(html_out, args.output)
+    _write_output(html_out.encode("utf-8"), args.output)
 
 
 if __name__ == "__main__":
@@ -27,8 +27,8 @@ import sys
 from typing import Any
 
 
-def _write_output(data: str, output_path: str | None) -> None:
-    """Write JSON string to file or stdout."""
+def _write_output(data: bytes, output_path: str | None) -> None:
+    """Write UTF-8 encoded JSON to file or stdout."""
     if output_path:
         abs_path = os.path.abspath(output_path)
         parent = os.path.dirname(abs_path)
@@ -36,10 +36,10 @@ def _write_output(data: str, output_path: str | None) -> None:
             print(f"Error: output path resolves to root directory: {output_path}", file=sys.stderr)
             sys.exit(1)
         os.makedirs(parent, exist_ok=True)
-        with open(abs_path, "w", encoding="utf-8") as f:
+        with open(abs_path, "wb") as f:
             f.write(data)
     else:
-        sys.stdout.write(data)
+        sys.stdout.buffer.write(data)
 
 
 # Canonical 22 checklist items — IDs match pitfalls-checklist.md
@@ -83,15 +83,31 @@ CHECKLIST_ITEMS: list[dict[str, str]] = [
     {"id": "sources_cited", "category": "Presentation", "label": "Sources cited"},
 ]
 
-VALID_IDS = {item["id"] for item in CHECKLIST_ITEMS}
-VALID_STATUSES = {"pass", "fail", "not_applicable"}
-ITEM_LOOKUP = {item["id"]: item for item in CHECKLIST_ITEMS}
+VALID_IDS = frozenset(item["id"] for item in CHECKLIST_ITEMS)
+VALID_STATUSES = frozenset({"pass", "fail", "not_applicable"})
+TOTAL = len(CHECKLIST_ITEMS)
+# Enriched-item skeletons; copied per item, then status and notes are filled in.
+_ENRICHED_TEMPLATES: dict[str, dict[str, Any]] = {
+    item["id"]: {
+        "id": item["id"],
+        "category": item["category"],
+        "label": item["label"],
+        "status": None,
+        "notes": None,
+    }
+    for item in CHECKLIST_ITEMS
+}
 
 
 def validate_checklist(items: list[dict[str, Any]]) -> dict[str, Any]:
     """Validate checklist input and produce summary."""
-    # Check for unknown IDs
-    seen_ids: set[str] = set()
+    # Validate and enrich in one pass; any invalid item exits immediately.
+    # enriched_by_id doubles as the seen-ID set for duplicate detection.
+    enriched_by_id: dict[str, dict[str, Any]] = {}
+    pass_count = 0
+    fail_count = 0
+    na_count = 0
+
     for item in items:
         if not isinstance(item, dict):
             print(f"Error: each item must be an object (got {type(item).__name__})", file=sys.stderr)
@@ -103,13 +119,12 @@ def validate_checklist(items: list[dict[str, Any]]) -> dict[str, Any]:
                 file=sys.stderr,
             )
             sys.exit(1)
-        if item_id in seen_ids:
+        if item_id in enriched_by_id:
             print(
                 f"Error: duplicate checklist ID '{item_id}'",
                 file=sys.stderr,
             )
             sys.exit(1)
-        seen_ids.add(item_id)
 
         status = item.get("status", "")
         if status not in VALID_STATUSES:
@@ -119,67 +134,52 @@ def validate_checklist(items: list[dict[str, Any]]) -> dict[str, Any]:
             )
             sys.exit(1)
 
-    # Check all 22 IDs present
-    missing = VALID_IDS - seen_ids
-    if missing:
-        print(
-            f"Error: missing checklist items: {sorted(missing)}",
-            file=sys.stderr,
-        )
-        sys.exit(1)
-
-    # Build enriched items and summary
-    enriched: list[dict[str, Any]] = []
-    pass_count = 0
-    fail_count = 0
-    na_count = 0
-    failed_items: list[dict[str, Any]] = []
-
-    for item in items:
-        item_id = item["id"]
-        meta = ITEM_LOOKUP[item_id]
-        status = item["status"]
         raw_notes = item.get("notes")
-        notes = str(raw_notes) if raw_notes is not None else None
-
-        enriched.append(
-            {
-                "id": item_id,
-                "category": meta["category"],
-                "label": meta["label"],
-                "status": status,
-                "notes": notes,
-            }
-        )
+        # JSON notes are normally null or a string; only other values need str()
+        notes = raw_notes if raw_notes is None or type(raw_notes) is str else str(raw_notes)
+
+        entry = _ENRICHED_TEMPLATES[item_id].copy()
+        entry["status"] = status
+        entry["notes"] = notes
+        enriched_by_id[item_id] = entry
 
         if status == "pass":
             pass_count += 1
         elif status == "fail":
             fail_count += 1
-            failed_items.append(
-                {
-                    "id": item_id,
-                    "category": meta["category"],
-                    "label": meta["label"],
-                    "notes": notes,
-                }
-            )
         elif status == "not_applicable":
             na_count += 1
 
-    # Sort by canonical order
-    canonical_order = {item["id"]: i for i, item in enumerate(CHECKLIST_ITEMS)}
-    enriched.sort(key=lambda x: canonical_order.get(x["id"], 999))
+    # Check all 22 IDs present; keys are valid and unique, so a full count means none missing
+    if len(enriched_by_id) != TOTAL:
+        missing = VALID_IDS - enriched_by_id.keys()
+        print(
+            f"Error: missing checklist items: {sorted(missing)}",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+    # Failed items in input order, built only when something failed
+    failed_items: list[dict[str, Any]] = []
+    if fail_count:
+        failed_items = [
+            {"id": row["id"], "category": row["category"], "label": row["label"], "notes": row["notes"]}
+            for row in enriched_by_id.values()
+            if row["status"] == "fail"
+        ]
+
+    # Canonical order: every ID is present exactly once, so walk the canonical list
+    enriched = [enriched_by_id[item["id"]] for item in CHECKLIST_ITEMS]
 
     overall = "pass" if fail_count == 0 else "fail"
 
-    applicable = len(CHECKLIST_ITEMS) - na_count
+    applicable = TOTAL - na_count
     score_pct = round((pass_count / applicable) * 100, 1) if applicable > 0 else 0.0
 
     return {
         "items": enriched,
         "summary": {
-            "total": len(CHECKLIST_ITEMS),
+            "total": TOTAL,
             "pass": pass_count,
             "fail": fail_count,
             "not_applicable": na_count,
@@ -209,8 +209,8 @@ def main() -> None:
         sys.exit(1)
 
     try:
-        data = json.load(sys.stdin)
-    except json.JSONDecodeError as e:
+        data = json.loads(sys.stdin.buffer.read())
+    except ValueError as e:  # JSONDecodeError or undecodable bytes
         print(f"Error: invalid JSON input: {e}", file=sys.stderr)
         sys.exit(1)
 
@@ -225,7 +225,7 @@ def main() -> None:
     result = validate_checklist(data["items"])
 
     indent = 2 if args.pretty else None
-    out = json.dumps(result, indent=indent) + "\n"
+    out = (json.dumps(result, indent=indent, ensure_ascii=False) + "\n").encode("utf-8", "backslashreplace")
     _write_output(out, args.output)
 
 
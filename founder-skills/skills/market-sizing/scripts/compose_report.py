@@ -64,6 +64,18 @@ QUANTITATIVE_PARAMS = {
     "share_pct",
 }
 
+# Sizing approaches and metrics in report order; the frozensets serve membership tests
+_APPROACHES = ("top_down", "bottom_up")
+_APPROACH_KEYS = frozenset(_APPROACHES)
+_METRICS = ("tam", "sam", "som")
+
+# Sizing inputs rendered as currency in the report's Key Assumptions column
+_USD_INPUT_KEYS = frozenset({"industry_total", "arpu", "tam", "sam"})
+# Assumption names whose values are monetary
+_MONETARY_PARAMS = frozenset({"industry_total", "arpu"})
+# Severities that fail --strict
+_BLOCKING_SEVERITIES = frozenset({"high", "medium"})
+
 REQUIRED_ARTIFACTS = ["inputs.json", "methodology.json", "validation.json", "sizing.json", "checklist.json"]
 OPTIONAL_ARTIFACTS = ["sensitivity.json"]
 
@@ -104,16 +116,23 @@ WARNING_LABELS: dict[str, str] = {
 
 def _humanize_param(name: str) -> str:
     """Convert a parameter name to human-readable label."""
-    return PARAM_LABELS.get(name, name.replace("_", " ").title())
+    # Known names skip building the title-cased fallback.
+    label = PARAM_LABELS.get(name)
+    return label if label is not None else name.replace("_", " ").title()
 
 
 def _humanize_warning(code: str) -> str:
     """Convert a warning code to human-readable label."""
-    return WARNING_LABELS.get(code, code.replace("_", " ").title())
+    label = WARNING_LABELS.get(code)
+    return label if label is not None else code.replace("_", " ").title()
 
 
 def _fmt_number(value: Any) -> str:
     """Format a numeric value for display (with commas, no unnecessary decimals)."""
+    # Plain ints (counts, percentages) are the common case; bools and other
+    # int subclasses still take the isinstance path below.
+    if type(value) is int:
+        return f"{value:,}"
     if isinstance(value, float):
         if value == int(value):
             return f"{int(value):,}"
@@ -139,14 +158,18 @@ def _write_output(data: str, output_path: str | None) -> None:
 
 
 def _load_artifact(dir_path: str, name: str) -> dict[str, Any] | None:
-    """Load a JSON artifact. Returns None if missing, _CORRUPT if unparseable."""
+    """Load a JSON artifact. Returns None if missing, _CORRUPT if unparseable or not UTF-8.
+
+    Callers skip names absent from a single os.listdir() of the directory rather
+    than probing each file; FileNotFoundError still maps to None.
+    """
     path = os.path.join(dir_path, name)
-    if not os.path.exists(path):
-        return None
     try:
-        with open(path, encoding="utf-8") as f:
-            return json.load(f)  # type: ignore[no-any-return]
-    except (json.JSONDecodeError, OSError):
+        with open(path, "rb") as f:
+            return json.loads(f.read())  # type: ignore[no-any-return]
+    except FileNotFoundError:
+        return None
+    except (ValueError, OSError):
         return _CORRUPT
 
 
@@ -160,6 +183,11 @@ def _usable(data: dict[str, Any] | None) -> TypeGuard[dict[str, Any]]:
     return data is not None and data is not _CORRUPT and not _is_stub(data)
 
 
+def _usable_or_none(data: dict[str, Any] | None) -> dict[str, Any] | None:
+    """Return the artifact if usable, else None (missing, corrupt, and stubs alike)."""
+    return data if _usable(data) else None
+
+
 def _as_list(value: Any) -> list[Any]:
     """Coerce to list — returns [] if not a list."""
     return value if isinstance(value, list) else []
@@ -186,14 +214,19 @@ def _md_safe(text: str) -> str:
     return text.replace("|", "\\|").replace("\n", " ")
 
 
-def _compute_delta(calculated: float, deck_claim: Any) -> float | None:
-    """Returns signed percentage delta, or None if claim is invalid."""
+def _positive_claim(deck_claim: Any) -> float | None:
+    """Coerce a deck claim to float. Returns None if missing, non-numeric, or <= 0."""
     try:
         claim = float(deck_claim)
     except (TypeError, ValueError):
         return None
     if claim <= 0:
         return None
+    return claim
+
+
+def _compute_delta(calculated: float, claim: float) -> float:
+    """Signed percentage delta of a calculated figure vs. a _positive_claim() value."""
     return round((calculated - claim) / claim * 100, 1)
 
 
@@ -222,50 +255,58 @@ def _compute_provenance(
     if inputs is not None and not _is_stub(inputs):
         existing_claims = _as_dict(inputs.get("existing_claims"))
 
+    # Deck claims are per metric, shared by both approaches; coerce each once.
+    claim_values = {metric: _positive_claim(existing_claims.get(metric)) for metric in _METRICS}
+
     provenance: dict[str, dict[str, Any]] = {}
     unresolved: list[tuple[str, str]] = []  # (param, metric) pairs
 
-    for approach_key in ("top_down", "bottom_up"):
+    for approach_key in _APPROACHES:
         approach_data = sizing.get(approach_key)
         if approach_data is None:
             continue
         approach_prov: dict[str, Any] = {}
-        for metric in ("tam", "sam", "som"):
+        for metric in _METRICS:
             m = _as_dict(approach_data.get(metric))
             figure_inputs = _as_dict(m.get("inputs"))
-            # Filter to quantitative params only (skip intermediates like tam, sam, etc.)
-            relevant_inputs = {k: v for k, v in figure_inputs.items() if k in QUANTITATIVE_PARAMS}
 
-            # Look up each input's category
+            # One pass over the inputs: look up each category, count the
+            # confidence breakdown, and track what the classification needs.
             input_provenances: dict[str, str] = {}
-            for param_name in relevant_inputs:
-                if param_name in assumption_map:
-                    input_provenances[param_name] = assumption_map[param_name]
-                else:
+            breakdown: dict[str, int] = {"sourced": 0, "derived": 0, "agent_estimate": 0}
+            has_agent_estimate = False
+            all_sourced = True
+            for param_name in figure_inputs:
+                # Quantitative params only (skip intermediates like tam, sam, etc.)
+                if param_name not in QUANTITATIVE_PARAMS:
+                    continue
+                cat = assumption_map.get(param_name)
+                if cat is None:
                     unresolved.append((param_name, metric.upper()))
+                    continue
+                input_provenances[param_name] = cat
+                if cat in breakdown:
+                    breakdown[cat] += 1
+                if cat == "agent_estimate":
+                    has_agent_estimate = True
+                elif cat != "sourced":
+                    all_sourced = False
 
             # Classify the figure
             if not input_provenances:
                 classification = "unknown"
+            elif has_agent_estimate:
+                classification = "agent_estimate"
+            elif all_sourced:
+                classification = "sourced"
             else:
-                categories = set(input_provenances.values())
-                if "agent_estimate" in categories:
-                    classification = "agent_estimate"
-                elif categories == {"sourced"}:
-                    classification = "sourced"
-                else:
-                    classification = "derived"
-
-            # Confidence breakdown
-            breakdown: dict[str, int] = {"sourced": 0, "derived": 0, "agent_estimate": 0}
-            for cat in input_provenances.values():
-                if cat in breakdown:
-                    breakdown[cat] += 1
+                classification = "derived"
 
             # Deck claim and delta
             deck_claim = existing_claims.get(metric)
             value = m.get("value", 0)
-            delta = _compute_delta(float(value), deck_claim) if deck_claim is not None else None
+            claim_value = claim_values[metric]
+            delta = _compute_delta(value, claim_value) if claim_value is not None else None
 
             approach_prov[metric] = {
                 "classification": classification,
@@ -281,6 +322,7 @@ def _compute_provenance(
 
 def _warn(code: str, message: str) -> dict[str, str]:
     """Create a warning dict with code, message, and severity from canonical map."""
+    # Fresh dict per call: compose() edits accepted warnings in place.
     return {
         "code": code,
         "message": message,
@@ -292,11 +334,14 @@ def validate_artifacts(artifacts: dict[str, dict[str, Any] | None]) -> list[dict
     """Run all 16 validation checks across artifacts. Returns list of warnings."""
     warnings: list[dict[str, str]] = []
 
-    methodology = artifacts.get("methodology.json")
-    validation = artifacts.get("validation.json")
-    sizing = artifacts.get("sizing.json")
-    sensitivity = artifacts.get("sensitivity.json")
-    checklist = artifacts.get("checklist.json")
+    # Usability is checked once per artifact; unusable ones are None below.
+    methodology = _usable_or_none(artifacts.get("methodology.json"))
+    validation = _usable_or_none(artifacts.get("validation.json"))
+    sizing = _usable_or_none(artifacts.get("sizing.json"))
+    sensitivity = _usable_or_none(artifacts.get("sensitivity.json"))
+    checklist = _usable_or_none(artifacts.get("checklist.json"))
+    inputs_art = _usable_or_none(artifacts.get("inputs.json"))
+    fig_vals = _as_list(validation.get("figure_validations")) if validation is not None else []
 
     # 1. CORRUPT_ARTIFACT / MISSING_ARTIFACT — required artifacts
     for name in REQUIRED_ARTIFACTS:
@@ -314,8 +359,20 @@ def validate_artifacts(artifacts: dict[str, dict[str, Any] | None]) -> list[dict
         elif data is None:
             warnings.append(_warn("MISSING_OPTIONAL_ARTIFACT", f"Optional artifact missing: {name}"))
 
+    # Every remaining check needs at least one usable artifact; an empty or
+    # fully broken directory stops at the missing/corrupt warnings above.
+    if (
+        validation is None
+        and sizing is None
+        and methodology is None
+        and checklist is None
+        and sensitivity is None
+        and inputs_art is None
+    ):
+        return warnings
+
     # 3. UNSOURCED_ASSUMPTIONS — agent_estimate assumptions not in sensitivity
-    if _usable(validation):
+    if validation is not None:
         agent_estimate_names: set[str] = set()
         for assumption in _as_list(validation.get("assumptions")):
             if assumption.get("category") == "agent_estimate":
@@ -324,7 +381,7 @@ def validate_artifacts(artifacts: dict[str, dict[str, Any] | None]) -> list[dict
                     agent_estimate_names.add(name)
 
         sensitivity_params: set[str] = set()
-        if _usable(sensitivity):
+        if sensitivity is not None:
             for scenario in _as_list(sensitivity.get("scenarios")):
                 if scenario.get("confidence") == "agent_estimate":
                     sensitivity_params.add(scenario.get("parameter", ""))
@@ -339,41 +396,49 @@ def validate_artifacts(artifacts: dict[str, dict[str, Any] | None]) -> list[dict
                 )
             )
 
-    # 4. UNVALIDATED_CLAIMS
-    if _usable(validation):
-        for fig in _as_list(validation.get("figure_validations")):
-            if fig.get("status") == "unsupported":
-                fig_display = fig.get("label", fig.get("figure", "unknown"))
-                warnings.append(
+    # 4-6 and 14 share one pass over figure_validations; each check's warnings
+    # are collected separately so they keep their place in the output order.
+    unvalidated: list[dict[str, str]] = []
+    refuted: list[dict[str, str]] = []
+    overclaimed: list[dict[str, str]] = []
+    for fig in fig_vals:
+        status = fig.get("status")
+        if status == "unsupported":
+            # 4. UNVALIDATED_CLAIMS
+            fig_display = fig.get("label", fig.get("figure", "unknown"))
+            unvalidated.append(_warn("UNVALIDATED_CLAIMS", f"Unsupported figure: {fig_display}"))
+        elif status == "refuted":
+            # 5. REFUTED_CLAIMS — surfaces refuted figures in warnings section
+            fig_display = fig.get("label", fig.get("figure", "unknown"))
+            refutation = fig.get("refutation")
+            if not refutation:
+                # 6. REFUTED_MISSING_REASON — refuted claim without explanation
+                refuted.append(
                     _warn(
-                        "UNVALIDATED_CLAIMS",
-                        f"Unsupported figure: {fig_display}",
+                        "REFUTED_MISSING_REASON",
+                        f"Refuted figure '{fig_display}' has no refutation explanation",
                     )
                 )
-
-    # 5. REFUTED_CLAIMS — surfaces refuted figures in warnings section
-    if _usable(validation):
-        for fig in _as_list(validation.get("figure_validations")):
-            if fig.get("status") == "refuted":
-                fig_display = fig.get("label", fig.get("figure", "unknown"))
-                refutation = fig.get("refutation")
-                if not refutation:
-                    # 6. REFUTED_MISSING_REASON — refuted claim without explanation
-                    warnings.append(
-                        _warn(
-                            "REFUTED_MISSING_REASON",
-                            f"Refuted figure '{fig_display}' has no refutation explanation",
-                        )
-                    )
-                warnings.append(
-                    _warn(
-                        "REFUTED_CLAIMS",
-                        f"Refuted figure: {fig_display} — {refutation or 'no explanation provided'}",
-                    )
+            refuted.append(
+                _warn(
+                    "REFUTED_CLAIMS",
+                    f"Refuted figure: {fig_display} — {refutation or 'no explanation provided'}",
                 )
+            )
+        elif status == "validated" and fig.get("source_count", 0) < 2:
+            # 14. OVERCLAIMED_VALIDATION
+            fig_display = fig.get("label", fig.get("figure", "unknown"))
+            overclaimed.append(
+                _warn(
+                    "OVERCLAIMED_VALIDATION",
+                    f"Figure '{fig_display}' marked validated but source_count={fig.get('source_count')}",
+                )
+            )
+    warnings.extend(unvalidated)
+    warnings.extend(refuted)
 
     # 7. APPROACH_MISMATCH
-    if _usable(methodology) and _usable(sizing):
+    if methodology is not None and sizing is not None:
         approach = methodology.get("approach_chosen", "")
         if approach == "both":
             if "top_down" not in sizing or "bottom_up" not in sizing:
@@ -383,7 +448,7 @@ def validate_artifacts(artifacts: dict[str, dict[str, Any] | None]) -> list[dict
                         "Methodology says 'both' but sizing.json missing top_down or bottom_up",
                     )
                 )
-        elif approach in ("top_down", "bottom_up") and approach not in sizing:
+        elif approach in _APPROACH_KEYS and approach not in sizing:
             warnings.append(
                 _warn(
                     "APPROACH_MISMATCH",
@@ -392,7 +457,7 @@ def validate_artifacts(artifacts: dict[str, dict[str, Any] | None]) -> list[dict
             )
 
     # 8. TAM_DISCREPANCY
-    if _usable(sizing):
+    if sizing is not None:
         comparison = _as_dict(sizing.get("comparison"))
         if comparison.get("tam_delta_pct", 0) > 30:
             warnings.append(
@@ -403,7 +468,7 @@ def validate_artifacts(artifacts: dict[str, dict[str, Any] | None]) -> list[dict
             )
 
     # 9. CHECKLIST_FAILURES
-    if _usable(checklist):
+    if checklist is not None:
         summary = _as_dict(checklist.get("summary"))
         if summary.get("overall_status") == "fail":
             failed = _as_list(summary.get("failed_items"))
@@ -416,7 +481,7 @@ def validate_artifacts(artifacts: dict[str, dict[str, Any] | None]) -> list[dict
             )
 
     # 10. CHECKLIST_INCOMPLETE
-    if _usable(checklist):
+    if checklist is not None:
         items = _as_list(checklist.get("items"))
         if len(items) != 22:
             warnings.append(
@@ -427,7 +492,7 @@ def validate_artifacts(artifacts: dict[str, dict[str, Any] | None]) -> list[dict
             )
 
     # 11. LOW_CHECKLIST_COVERAGE
-    if _usable(checklist):
+    if checklist is not None:
         summary = _as_dict(checklist.get("summary"))
         na_count = summary.get("not_applicable", 0)
         if na_count > 7:
@@ -439,7 +504,7 @@ def validate_artifacts(artifacts: dict[str, dict[str, Any] | None]) -> list[dict
             )
 
     # 12. FEW_SENSITIVITY_PARAMS
-    if _usable(sensitivity):
+    if sensitivity is not None:
         scenarios = _as_list(sensitivity.get("scenarios"))
         if len(scenarios) < 3:
             warnings.append(
@@ -450,7 +515,7 @@ def validate_artifacts(artifacts: dict[str, dict[str, Any] | None]) -> list[dict
             )
 
     # 13. NARROW_AGENT_ESTIMATE_RANGE
-    if _usable(sensitivity):
+    if sensitivity is not None:
         for scenario in _as_list(sensitivity.get("scenarios")):
             if scenario.get("confidence") == "agent_estimate":
                 eff = _as_dict(scenario.get("effective_range"))
@@ -465,43 +530,36 @@ def validate_artifacts(artifacts: dict[str, dict[str, Any] | None]) -> list[dict
                         )
                     )
 
-    # 14. OVERCLAIMED_VALIDATION
-    if _usable(validation):
-        for fig in _as_list(validation.get("figure_validations")):
-            if fig.get("status") == "validated" and fig.get("source_count", 0) < 2:
-                fig_display = fig.get("label", fig.get("figure", "unknown"))
-                warnings.append(
-                    _warn(
-                        "OVERCLAIMED_VALIDATION",
-                        f"Figure '{fig_display}' marked validated but source_count={fig.get('source_count')}",
-                    )
-                )
+    # 14. OVERCLAIMED_VALIDATION (collected in the figure_validations pass above)
+    warnings.extend(overclaimed)
 
     # 15. DECK_CLAIM_MISMATCH — deck claim differs from calculated by >50%
-    inputs_art = artifacts.get("inputs.json")
-    if _usable(sizing) and _usable(inputs_art):
+    if sizing is not None and inputs_art is not None:
         existing_claims = _as_dict(inputs_art.get("existing_claims"))
-        for approach_key in ("top_down", "bottom_up"):
+        claim_values = {metric: _positive_claim(existing_claims.get(metric)) for metric in _METRICS}
+        for approach_key in _APPROACHES:
             approach_data = sizing.get(approach_key)
             if approach_data is None:
                 continue
-            for metric in ("tam", "sam", "som"):
+            for metric in _METRICS:
+                claim = claim_values[metric]
+                if claim is None:
+                    continue
                 m = _as_dict(approach_data.get(metric))
                 val = m.get("value", 0)
-                claim = existing_claims.get(metric)
-                delta = _compute_delta(float(val), claim)
-                if delta is not None and abs(delta) > 50 and claim is not None:
+                delta = _compute_delta(val, claim)
+                if abs(delta) > 50:
                     warnings.append(
                         _warn(
                             "DECK_CLAIM_MISMATCH",
                             f"{metric.upper()} differs from deck claim by {delta:+.1f}% "
-                            f"(deck: {_fmt_usd(float(claim))}, calculated: {_fmt_usd(val)})",
+                            f"(deck: {_fmt_usd(claim)}, calculated: {_fmt_usd(val)})",
                         )
                     )
 
     # 16. PROVENANCE_UNRESOLVED — quantitative param in sizing inputs without matching assumption
-    if _usable(sizing) and _usable(validation):
-        provenance_result, unresolved = _compute_provenance(sizing, validation, artifacts.get("inputs.json"))
+    if sizing is not None and validation is not None:
+        provenance_result, unresolved = _compute_provenance(sizing, validation, inputs_art)
         if unresolved:
             # Aggregate: param -> list of metrics
             param_metrics: dict[str, list[str]] = {}
@@ -550,12 +608,12 @@ def _section_executive_summary(
     lines.append("| Metric | Value | Method |")
     lines.append("|--------|-------|--------|")
 
-    for approach_key in ("top_down", "bottom_up"):
+    for approach_key in _APPROACHES:
         approach_data = sizing.get(approach_key)
         if approach_data is None:
             continue
         method = "Top-down" if approach_key == "top_down" else "Bottom-up"
-        for metric in ("tam", "sam", "som"):
+        for metric in _METRICS:
             m = _as_dict(approach_data.get(metric))
             val = m.get("value", 0)
             lines.append(f"| {metric.upper()} | {_fmt_usd(val)} | {method} |")
@@ -568,10 +626,10 @@ def _section_executive_summary(
     # Flag significant deck claim deltas
     if provenance:
         both_mode = "top_down" in provenance and "bottom_up" in provenance
-        for metric in ("tam", "sam", "som"):
+        for metric in _METRICS:
             # Collect mismatches across approaches for this metric
             mismatches: list[tuple[str, float, float]] = []  # (label, val, deck_claim)
-            for approach_key in ("top_down", "bottom_up"):
+            for approach_key in _APPROACHES:
                 if approach_key not in provenance:
                     continue
                 prov = provenance[approach_key].get(metric, {})
@@ -704,21 +762,21 @@ def _section_sizing_table(
     lines.append("| Metric | Value | Method | Provenance | Key Assumptions |")
     lines.append("|--------|-------|--------|------------|-----------------|")
 
-    for approach_key in ("top_down", "bottom_up"):
+    for approach_key in _APPROACHES:
         approach_data = sizing.get(approach_key)
         if approach_data is None:
             continue
         method = "Top-down" if approach_key == "top_down" else "Bottom-up"
-        for metric in ("tam", "sam", "som"):
+        for metric in _METRICS:
             m = _as_dict(approach_data.get(metric))
             val = m.get("value", 0)
             inputs_data = _as_dict(m.get("inputs"))
-            assumption_parts = []
-            for k, v in inputs_data.items():
-                label = _humanize_param(k)
-                formatted = _fmt_usd(v) if k in ("industry_total", "arpu", "tam", "sam") else _fmt_number(v)
-                assumption_parts.append(f"{label}: {formatted}")
-            assumptions = ", ".join(assumption_parts)
+            assumptions = ", ".join(
+                [
+                    f"{_humanize_param(k)}: {_fmt_usd(v) if k in _USD_INPUT_KEYS else _fmt_number(v)}"
+                    for k, v in inputs_data.items()
+                ]
+            )
             # Look up provenance classification
             prov_label = ""
             if provenance and approach_key in provenance:
@@ -735,10 +793,10 @@ def _section_sizing_table(
     # Deck Claims comparison table
     if provenance:
         comparison_rows: list[str] = []
-        for approach_key in ("top_down", "bottom_up"):
+        for approach_key in _APPROACHES:
             if approach_key not in provenance:
                 continue
-            for metric in ("tam", "sam", "som"):
+            for metric in _METRICS:
                 prov = provenance[approach_key].get(metric, {})
                 deck_claim = prov.get("deck_claim")
                 delta_pct = prov.get("delta_vs_deck_pct")
@@ -774,15 +832,13 @@ def _section_assumptions(validation: dict[str, Any] | None) -> str:
 
     lines = ["## Assumptions\n"]
     cat_labels = {"sourced": "Sourced", "derived": "Derived", "agent_estimate": "Estimate"}
-    # Params whose values are monetary
-    monetary_params = {"industry_total", "arpu"}
     for a in assumptions:
         cat = a.get("category", "unknown")
         cat_display = cat_labels.get(cat, cat)
         name = a.get("name", "unnamed")
         display_name = a.get("label", _humanize_param(name))
         value = a.get("value", "")
-        if isinstance(value, (int, float)) and name in monetary_params:
+        if isinstance(value, (int, float)) and name in _MONETARY_PARAMS:
             formatted_val = _fmt_usd(value)
         elif isinstance(value, (int, float)):
             formatted_val = _fmt_number(value)
@@ -932,9 +988,10 @@ def compose(dir_path: str) -> dict[str, Any]:
     """Main composition: load artifacts, validate, assemble report."""
     # Load all artifacts
     all_names = REQUIRED_ARTIFACTS + OPTIONAL_ARTIFACTS
+    present = set(os.listdir(dir_path))
     artifacts: dict[str, dict[str, Any] | None] = {}
     for name in all_names:
-        artifacts[name] = _load_artifact(dir_path, name)
+        artifacts[name] = _load_artifact(dir_path, name) if name in present else None
 
     artifacts_found = [n for n in all_names if artifacts[n] is not None and artifacts[n] is not _CORRUPT]
     artifacts_missing = [n for n in all_names if artifacts[n] is None]
@@ -1063,7 +1120,7 @@ def main() -> None:
     _write_output(out, args.output)
 
     if args.strict:
-        blocking = [w for w in result["validation"]["warnings"] if w["severity"] in ("high", "medium")]
+        blocking = [w for w in result["validation"]["warnings"] if w["severity"] in _BLOCKING_SEVERITIES]
         if blocking:
             print("STRICT MODE: Exiting with code 1 due to warnings", file=sys.stderr)
             sys.exit(1)
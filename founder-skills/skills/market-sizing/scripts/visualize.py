@@ -54,14 +54,18 @@ QUANTITATIVE_PARAMS = {
 
 
 def _load_artifact(dir_path: str, name: str) -> dict[str, Any] | None:
-    """Load a JSON artifact. Returns None if missing, _CORRUPT if unparseable."""
+    """Load a JSON artifact. Returns None if missing, _CORRUPT if unparseable or not UTF-8.
+
+    Callers skip names absent from a single os.listdir() of the directory rather
+    than probing each file; FileNotFoundError still maps to None.
+    """
     path = os.path.join(dir_path, name)
-    if not os.path.exists(path):
-        return None
     try:
-        with open(path, encoding="utf-8") as f:
-            return json.load(f)  # type: ignore[no-any-return]
-    except (json.JSONDecodeError, OSError):
+        with open(path, "rb") as f:
+            return json.loads(f.read())  # type: ignore[no-any-return]
+    except FileNotFoundError:
+        return None
+    except (ValueError, OSError):
         return _CORRUPT
 
 
@@ -1225,9 +1229,10 @@ def _chart_key_findings(
 def compose_html(dir_path: str) -> str:
     """Load artifacts and compose full HTML report."""
     all_names = REQUIRED_ARTIFACTS + OPTIONAL_ARTIFACTS
+    present = set(os.listdir(dir_path))
     artifacts: dict[str, dict[str, Any] | None] = {}
     for name in all_names:
-        artifacts[name] = _load_artifact(dir_path, name)
+        artifacts[name] = _load_artifact(dir_path, name) if name in present else None
 
     inputs = artifacts.get("inputs.json")
     sizing = artifacts.get("sizing.json")
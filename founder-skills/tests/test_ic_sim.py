@@ -253,6 +253,16 @@ def test_score_missing_items() -> None:
     assert any("missing" in e.lower() for e in data["validation"]["errors"])
 
 
+def test_score_missing_items_canonical_order() -> None:
+    """Missing dimension IDs are listed in canonical (category) order."""
+    items = _make_dimension_items(exclude=["biz_unit_economics", "team_coachability"])
+    payload = json.dumps({"items": items})
+    rc, data, _ = run_script("score_dimensions.py", ["--pretty"], stdin_data=payload)
+    assert rc == 0
+    assert data is not None
+    assert data["validation"]["errors"] == ["Missing dimensions: ['team_coachability', 'biz_unit_economics']"]
+
+
 def test_score_duplicate_id() -> None:
     """Duplicate ID -> validation.status = invalid."""
     items = _make_dimension_items()
@@ -306,6 +316,30 @@ def test_score_output_flag() -> None:
             os.unlink(tmp)
 
 
+def test_score_non_ascii_round_trip() -> None:
+    """Non-ASCII evidence is echoed as unescaped UTF-8."""
+    overrides = {"team_coachability": {"status": "concern", "evidence": "Gründer — résistant", "notes": None}}
+    payload = json.dumps({"items": _make_dimension_items(overrides=overrides)}, ensure_ascii=False)
+    cmd = [sys.executable, os.path.join(IC_SIM_DIR, "score_dimensions.py")]
+    result = subprocess.run(cmd, input=payload.encode("utf-8"), capture_output=True)
+    assert result.returncode == 0, result.stderr
+    assert "Gründer — résistant".encode() in result.stdout
+    data = json.loads(result.stdout.decode("utf-8"))
+    assert data["summary"]["top_concerns"][0]["evidence"] == "Gründer — résistant"
+
+
+def test_score_lone_surrogate_escape() -> None:
+    """Escaped lone surrogate in evidence -> exit 0, re-emitted as a JSON escape."""
+    overrides = {"team_coachability": {"status": "concern", "evidence": "bad \ud800 text", "notes": None}}
+    payload = json.dumps({"items": _make_dimension_items(overrides=overrides)})
+    cmd = [sys.executable, os.path.join(IC_SIM_DIR, "score_dimensions.py")]
+    result = subprocess.run(cmd, input=payload.encode("utf-8"), capture_output=True)
+    assert result.returncode == 0, result.stderr
+    assert b"\\ud800" in result.stdout
+    data = json.loads(result.stdout)
+    assert data["summary"]["top_concerns"][0]["evidence"] == "bad \ud800 text"
+
+
 # ============================================================
 # fund_profile.py tests
 # ============================================================
@@ -1499,6 +1533,32 @@ def test_compose_corrupt_artifact() -> None:
     assert not any("discussion.json" in m for m in missing_msgs)
 
 
+def test_compose_non_utf8_artifact_is_corrupt() -> None:
+    """Artifact with invalid UTF-8 bytes -> CORRUPT_ARTIFACT, not a crash."""
+    arts = _all_required_artifacts()
+    d = _make_artifact_dir(arts)
+    with open(os.path.join(d, "discussion.json"), "wb") as f:
+        f.write(b'{"assessment_mode": "\xff"}')
+    rc, data, _ = _run_compose(d)
+    assert rc == 0
+    assert data is not None
+    codes = [w["code"] for w in data["validation"]["warnings"]]
+    assert "CORRUPT_ARTIFACT" in codes
+
+
+def test_compose_lone_surrogate_in_artifact() -> None:
+    """Escaped lone surrogate in company_name -> report still written, rc 0."""
+    arts = _all_required_artifacts()
+    startup = dict(_VALID_STARTUP)
+    startup["company_name"] = "Bad \ud800 Co"
+    arts["startup_profile.json"] = startup
+    d = _make_artifact_dir(arts)
+    rc, data, stderr = _run_compose(d)
+    assert rc == 0, stderr
+    assert data is not None
+    assert "Bad \ud800 Co" in data["report_markdown"]
+
+
 def test_compose_output_flag() -> None:
     """compose_report.py with -o writes JSON to file, stdout empty."""
     arts = _all_required_artifacts()
@@ -1518,6 +1578,17 @@ def test_compose_output_flag() -> None:
             os.unlink(tmp)
 
 
+def test_compose_output_utf8() -> None:
+    """compose_report.py emits UTF-8 JSON with non-ASCII characters unescaped."""
+    d = _make_artifact_dir(_all_required_artifacts())
+    cmd = [sys.executable, os.path.join(IC_SIM_DIR, "compose_report.py"), "--dir", d]
+    result = subprocess.run(cmd, capture_output=True)
+    assert result.returncode == 0, result.stderr
+    assert b"\\u2014" not in result.stdout
+    data = json.loads(result.stdout.decode("utf-8"))
+    assert "—" in data["report_markdown"]
+
+
 def _run_compose_with_args(artifact_dir: str, extra_args: list[str] | None = None) -> tuple[int, dict | None, str]:
     """Run compose_report.py with given artifact dir and extra args."""
     args = ["--dir", artifact_dir, "--pretty"]
@@ -1615,6 +1686,51 @@ def test_conflicts_duplicate_company_deduped() -> None:
     assert "duplicate" in stderr.lower()
 
 
+def test_conflicts_non_ascii_round_trip() -> None:
+    """Non-ASCII company names are read as UTF-8 and echoed unescaped."""
+    payload = json.dumps(
+        {
+            "portfolio_size": 3,
+            "conflicts": [
+                {"company": "Zürich Pay", "type": "direct", "severity": "manageable", "rationale": "Overlap"}
+            ],
+        },
+        ensure_ascii=False,
+    )
+    cmd = [sys.executable, os.path.join(IC_SIM_DIR, "detect_conflicts.py")]
+    result = subprocess.run(cmd, input=payload.encode("utf-8"), capture_output=True)
+    assert result.returncode == 0, result.stderr
+    assert "Zürich Pay".encode() in result.stdout
+    data = json.loads(result.stdout.decode("utf-8"))
+    assert data["conflicts"][0]["company"] == "Zürich Pay"
+
+
+def test_conflicts_lone_surrogate_round_trip() -> None:
+    """Lone surrogate, JSON-escaped or as raw UTF-8 bytes -> exit 0, emitted as \\udXXX."""
+    escaped = json.dumps(
+        {
+            "portfolio_size": 3,
+            "conflicts": [{"company": "A\udc80", "type": "direct", "severity": "manageable", "rationale": "Overlap"}],
+        }
+    ).encode("ascii")
+    raw = escaped.replace(b"\\udc80", b"\xed\xb2\x80")
+    cmd = [sys.executable, os.path.join(IC_SIM_DIR, "detect_conflicts.py")]
+    for payload in (escaped, raw):
+        result = subprocess.run(cmd, input=payload, capture_output=True)
+        assert result.returncode == 0, result.stderr
+        assert json.loads(result.stdout)["conflicts"][0]["company"] == "A\udc80"
+
+
+def test_fund_profile_lone_surrogate_round_trip() -> None:
+    """Escaped lone surrogate in fund_name -> exit 0, emitted as \\udXXX."""
+    profile = dict(_VALID_GENERIC_PROFILE)
+    profile["fund_name"] = "Fund \ud800"
+    rc, data, stderr = run_script("fund_profile.py", [], stdin_data=json.dumps(profile))
+    assert rc == 0, stderr
+    assert data is not None
+    assert data["fund_name"] == "Fund \ud800"
+
+
 def test_compose_orphaned_conflict_normalized() -> None:
     """Conflict 'FinLedger' vs portfolio 'FinLedger Inc.' -> no ORPHANED_CONFLICT after normalization."""
     arts = _all_required_artifacts()
@@ -1700,6 +1816,30 @@ def test_compose_accepted_warning() -> None:
     assert unanimity_w[0]["severity"] == "acknowledged"
 
 
+def test_compose_accepted_warning_non_string_match_skipped() -> None:
+    """accepted_warnings entry with a non-string match -> skipped, warning not acknowledged."""
+    arts = _all_required_artifacts()
+    fund = dict(_VALID_FUND)
+    fund["accepted_warnings"] = [
+        {"code": "PARTNER_UNANIMITY", "reason": "Intentional convergence", "match": 3},
+    ]
+    arts["fund_profile.json"] = fund
+    arts["discussion.json"] = dict(_VALID_DISCUSSION)
+    arts["discussion.json"]["partner_verdicts"] = [
+        {"partner": "visionary", "verdict": "invest", "rationale": "Great company, strong team."},
+        {"partner": "operator", "verdict": "invest", "rationale": "Great company, strong team."},
+        {"partner": "analyst", "verdict": "invest", "rationale": "Different analysis, solid numbers."},
+    ]
+    d = _make_artifact_dir(arts)
+    rc, data, stderr = _run_compose(d)
+    assert rc == 0
+    assert data is not None
+    unanimity_w = [w for w in data["validation"]["warnings"] if w["code"] == "PARTNER_UNANIMITY"]
+    assert len(unanimity_w) == 1
+    assert unanimity_w[0]["severity"] != "acknowledged"
+    assert "missing 'code' or 'match'" in stderr
+
+
 def test_compose_malformed_field_types() -> None:
     """Artifact with wrong field type (string instead of list) should not crash."""
     arts = _all_required_artifacts()
@@ -1951,6 +2091,24 @@ def test_compose_coaching_evidence_fallback_from_items() -> None:
     assert "Prepare:" in md
 
 
+def test_compose_null_label_falls_back_to_id() -> None:
+    """Dealbreaker with label: null renders its id, not 'None'."""
+    arts = _all_required_artifacts()
+    score = dict(_VALID_SCORE)
+    score["summary"] = dict(_VALID_SCORE["summary"])
+    score["summary"]["dealbreakers"] = [
+        {"id": "team_founder_market_fit", "label": None, "category": "Team", "evidence": "Solo founder"},
+    ]
+    arts["score_dimensions.json"] = score
+    d = _make_artifact_dir(arts)
+    rc, data, _ = _run_compose(d)
+    assert rc == 0
+    assert data is not None
+    md = data["report_markdown"]
+    assert "**team_founder_market_fit**" in md
+    assert "**None**" not in md
+
+
 def test_compose_coaching_dealbreakers_before_concerns() -> None:
     """Dealbreakers appear before concerns in coaching section."""
     arts = _all_required_artifacts()
@@ -396,6 +396,29 @@ def test_checklist_score_pct() -> None:
     assert s["score_pct"] == expected
 
 
+def test_checklist_non_ascii_notes_round_trip() -> None:
+    """Non-ASCII notes are echoed as unescaped UTF-8."""
+    overrides = {"data_current": {"status": "fail", "notes": "Données de 2019 — obsolètes"}}
+    payload = json.dumps({"items": _make_checklist_items(overrides=overrides)}, ensure_ascii=False)
+    cmd = [sys.executable, os.path.join(MARKET_SIZING_DIR, "checklist.py")]
+    result = subprocess.run(cmd, input=payload.encode("utf-8"), capture_output=True)
+    assert result.returncode == 0, result.stderr
+    assert "Données de 2019 — obsolètes".encode() in result.stdout
+    data = json.loads(result.stdout.decode("utf-8"))
+    assert data["summary"]["failed_items"][0]["notes"] == "Données de 2019 — obsolètes"
+
+
+def test_checklist_lone_surrogate_notes() -> None:
+    """Escaped lone surrogate in notes -> exit 0, re-emitted as a JSON escape."""
+    overrides = {"data_current": {"status": "fail", "notes": "x\ud800"}}
+    payload = json.dumps({"items": _make_checklist_items(overrides=overrides)})
+    cmd = [sys.executable, os.path.join(MARKET_SIZING_DIR, "checklist.py")]
+    result = subprocess.run(cmd, input=payload.encode("utf-8"), capture_output=True)
+    assert result.returncode == 0, result.stderr
+    data = json.loads(result.stdout)
+    assert data["summary"]["failed_items"][0]["notes"] == "x\ud800"
+
+
 # -- Helpers for compose_report.py tests --
 
 
@@ -659,6 +682,32 @@ def test_compose_overclaimed_validation() -> None:
     assert "OVERCLAIMED_VALIDATION" in codes
 
 
+def test_compose_figure_warnings_keep_check_order() -> None:
+    """Mixed figure statuses -> warnings grouped by check, not by figure order."""
+    validation = dict(_VALID_VALIDATION)
+    validation["figure_validations"] = [
+        {"figure": "TAM", "status": "validated", "source_count": 1},
+        {"figure": "SAM", "status": "refuted", "refutation": "Too broad"},
+        {"figure": "SOM", "status": "unsupported", "source_count": 0},
+    ]
+    d = _make_artifact_dir(
+        {
+            "inputs.json": _VALID_INPUTS,
+            "methodology.json": _VALID_METHODOLOGY,
+            "validation.json": validation,
+            "sizing.json": _VALID_SIZING,
+            "sensitivity.json": _VALID_SENSITIVITY,
+            "checklist.json": _VALID_CHECKLIST,
+        }
+    )
+    rc, data, _ = _run_compose(d)
+    assert rc == 0
+    assert data is not None
+    codes = [w["code"] for w in data["validation"]["warnings"]]
+    figure_codes = [c for c in codes if c in ("UNVALIDATED_CLAIMS", "REFUTED_CLAIMS", "OVERCLAIMED_VALIDATION")]
+    assert figure_codes == ["UNVALIDATED_CLAIMS", "REFUTED_CLAIMS", "OVERCLAIMED_VALIDATION"]
+
+
 def test_compose_approach_mismatch() -> None:
     """Methodology says 'both', sizing has only top_down -> APPROACH_MISMATCH."""
     sizing_only_td = {"approach": "both", "top_down": _VALID_SIZING["top_down"]}
@@ -1682,6 +1731,38 @@ def test_compose_corrupt_required_artifact() -> None:
     assert not any("sizing.json" in m for m in missing_msgs)
 
 
+def test_compose_empty_dir() -> None:
+    """No artifacts at all -> only missing-artifact warnings, report still composed."""
+    d = _make_artifact_dir({})
+    rc, data, _ = _run_compose(d)
+    assert rc == 0
+    assert data is not None
+    codes = [w["code"] for w in data["validation"]["warnings"]]
+    assert codes == ["MISSING_ARTIFACT"] * 5 + ["MISSING_OPTIONAL_ARTIFACT"]
+    assert data["validation"]["artifacts_found"] == []
+    assert "report_markdown" in data
+
+
+def test_compose_non_utf8_artifact_is_corrupt() -> None:
+    """Required artifact with invalid UTF-8 bytes -> CORRUPT_ARTIFACT, not a crash."""
+    d = _make_artifact_dir(
+        {
+            "inputs.json": _VALID_INPUTS,
+            "methodology.json": _VALID_METHODOLOGY,
+            "validation.json": _VALID_VALIDATION,
+            "sensitivity.json": _VALID_SENSITIVITY,
+            "checklist.json": _VALID_CHECKLIST,
+        }
+    )
+    with open(os.path.join(d, "sizing.json"), "wb") as f:
+        f.write(b'{"tam": "\xff"}')
+    rc, data, _ = _run_compose(d)
+    assert rc == 0
+    assert data is not None
+    corrupt_msgs = [w["message"] for w in data["validation"]["warnings"] if w["code"] == "CORRUPT_ARTIFACT"]
+    assert any("sizing.json" in m for m in corrupt_msgs)
+
+
 def test_compose_strict_mode_optional_only_missing() -> None:
     """Strict mode succeeds when only optional artifacts are missing (low severity)."""
     d = _make_artifact_dir(
@@ -2270,6 +2351,33 @@ def test_compose_provenance_classification_correctness() -> None:
     assert td2.get("tam", {}).get("classification") == "sourced"
 
 
+def test_compose_provenance_classification_derived() -> None:
+    """Sourced + derived inputs (no agent_estimate) → derived, with per-category breakdown."""
+    validation_derived = {
+        "sources": [],
+        "figure_validations": [],
+        "assumptions": [
+            {"name": "customer_count", "value": 4500000, "category": "sourced"},
+            {"name": "arpu", "value": 15000, "category": "derived"},
+        ],
+    }
+    arts = {
+        "inputs.json": _VALID_INPUTS,
+        "methodology.json": _VALID_METHODOLOGY,
+        "validation.json": validation_derived,
+        "sizing.json": _VALID_SIZING,
+        "checklist.json": _VALID_CHECKLIST,
+        "sensitivity.json": _VALID_SENSITIVITY,
+    }
+    d = _make_artifact_dir(arts)
+    rc, data, _stderr = run_script("compose_report.py", ["--dir", d])
+    assert rc == 0
+    assert data is not None
+    bu_tam = data["provenance"]["bottom_up"]["tam"]
+    assert bu_tam["classification"] == "derived"
+    assert bu_tam["confidence_breakdown"] == {"sourced": 1, "derived": 1, "agent_estimate": 0}
+
+
 def test_compose_deck_claim_zero() -> None:
     """existing_claims: {tam: 0} → no comparison row for TAM (delta is None)."""
     inputs: dict[str, Any] = dict(_VALID_INPUTS)
@@ -336,6 +336,17 @@ def test_corrupt_artifact() -> None:
     assert "Data unavailable" in stdout
 
 
+def test_non_utf8_artifact_is_corrupt() -> None:
+    """discussion.json with invalid UTF-8 bytes -> placeholder, not a crash."""
+    arts = _all_required_artifacts()
+    d = _make_artifact_dir(arts)
+    with open(os.path.join(d, "discussion.json"), "wb") as f:
+        f.write(b'{"assessment_mode": "\xff"}')
+    rc, stdout, stderr = _run_visualize(d)
+    assert rc == 0, f"exit {rc}, stderr={stderr}"
+    assert "Data unavailable" in stdout
+
+
 def test_stub_artifact() -> None:
     """score_dimensions.json = stub -> placeholder with reason."""
     arts = _all_required_artifacts()
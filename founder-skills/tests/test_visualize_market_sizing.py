@@ -325,6 +325,16 @@ def test_corrupt_artifact() -> None:
     assert "Data unavailable" in stdout
 
 
+def test_non_utf8_artifact_is_corrupt() -> None:
+    """sizing.json with invalid UTF-8 bytes -- placeholder shown, not a crash."""
+    d = _make_artifact_dir(_all_artifacts())
+    with open(os.path.join(d, "sizing.json"), "wb") as f:
+        f.write(b'{"tam": "\xff"}')
+    rc, stdout, _stderr = _run_visualize(d)
+    assert rc == 0
+    assert "Data unavailable" in stdout
+
+
 def test_stub_artifact() -> None:
     """Stub sizing.json with reason -- placeholder shows reason."""
     arts = dict(_all_artifacts())